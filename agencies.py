@@ -0,0 +1,48 @@
+from functools import partial
+
+import profiling
+import crawler_kijaebu
+import crawler_gooksechung
+import crawler_customs
+import crawler_pps
+import crawler_kostat
+from crawler_common import Board, iter_board, scrape_board
+
+# 기관 키와 화면에 표시할 기관명 (사이드바 순서와 같음)
+AGENCY_NAMES = {
+    "moef": "기획재정부",
+    "nts": "국세청",
+    "customs": "관세청",
+    "pps": "조달청",
+    "kostat": "통계청"
+}
+
+# 기관 키별 게시판 (기관명, 동시 요청 수를 정하는 목록 주소, 크롤러 모듈). crawler_common.Board 참고
+BOARDS = {
+    "moef": Board(AGENCY_NAMES["moef"], crawler_kijaebu.BASE_URL, crawler_kijaebu),
+    "nts": Board(AGENCY_NAMES["nts"], crawler_gooksechung.URL, crawler_gooksechung),
+    "customs": Board(AGENCY_NAMES["customs"], crawler_customs.URL, crawler_customs),
+    "pps": Board(AGENCY_NAMES["pps"], crawler_pps.BASE_URL, crawler_pps),
+    "kostat": Board(AGENCY_NAMES["kostat"], crawler_kostat.BASE_URL, crawler_kostat)
+}
+
+# 기관 키별 크롤러 모듈 (fetch_page, parse_page, PAGE_PATTERN 을 가짐)
+CRAWLER_MODULES = {key: board.module for key, board in BOARDS.items()}
+
+# 기관 키별 전체 크롤링 함수 (max_workers=None, known_ids=None 을 받아 게시글 리스트를 반환)
+SCRAPE_FUNCS = {key: partial(scrape_board, board) for key, board in BOARDS.items()}
+
+# 기관 키별 스트리밍 크롤링 함수 ((페이지 번호, 게시글 리스트) 를 yield, 인자는 crawler_common.iter_board 참고)
+ITER_FUNCS = {key: partial(iter_board, board) for key, board in BOARDS.items()}
+
+
+def main(agency):
+    """
+    크롤러 모듈을 스크립트로 실행할 때(python crawler_pps.py) 기관 게시판 전체를 크롤링해 처음 몇 건을 출력합니다.
+    --profile 을 붙이면 profiling.profiled(agency) 로 측정합니다.
+    """
+    with profiling.profile_if_requested(agency):
+        results = SCRAPE_FUNCS[agency]()
+    print(f"총 항목 수: {len(results)}")
+    for item in results[:5]:
+        print(item)
@@ -0,0 +1,105 @@
+"""
+로컬 대역 서버(benchmarks/stub_server.py)를 띄워 각 기관의 전체 크롤링 시간을 측정합니다.
+같은 조건(지연, 오류율)에서 순차 크롤링(동시 요청 1개)과 동시 크롤링을 비교할 수 있습니다.
+크롤링 자체의 처리량을 재기 위해 기본으로 호스트별 속도 제한(resilience)을 끕니다. (--rate-limit 로 지정 가능)
+
+사용법 (저장소 최상위에서):
+    python benchmarks/bench_crawl.py --latency 0.05
+    python benchmarks/bench_crawl.py --agency pps --workers 1 --workers 8 --error-rate 0.02
+    python benchmarks/bench_crawl.py --latency 0 --workers 8 --parse-processes 0 --parse-processes 8
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import http_client  # noqa: E402
+import resilience  # noqa: E402
+from agencies import SCRAPE_FUNCS, BOARDS  # noqa: E402
+from http_client import get_max_workers  # noqa: E402
+from crawler_common import get_parse_pool, set_parse_processes  # noqa: E402
+from stub_server import start_server  # noqa: E402
+
+
+def bench_agency(agency, workers, parse_processes=0):
+    """agency 를 동시 요청 workers 개, 파싱 프로세스 parse_processes 개로 전체 크롤링하고 측정값을 반환합니다."""
+    http_client.reset_session()
+    resilience.reset()
+    start = time.perf_counter()
+    records = SCRAPE_FUNCS[agency](max_workers=workers)
+    elapsed = time.perf_counter() - start
+    stats = http_client.connection_stats()
+    return {
+        "agency": agency,
+        "workers": workers,
+        "parse_processes": parse_processes,
+        "seconds": elapsed,
+        "rows": len(records),
+        "requests": sum(s["requests"] for s in stats.values()),
+        "connections": sum(s["connections"] for s in stats.values()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대역 서버로 기관별 전체 크롤링 시간을 측정합니다.")
+    parser.add_argument("--agency", choices=sorted(SCRAPE_FUNCS), action="append",
+                        help="측정할 기관 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--workers", type=int, action="append",
+                        help="동시 요청 수 (여러 번 지정 가능, 기본: 1 과 호스트별 기본값)")
+    parser.add_argument("--latency", type=float, default=0.05, help="대역 서버 응답 지연(초, 기본: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연의 ± 변동 폭(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 응답 비율 (0~1)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="응답하지 않는 요청 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="호스트별 초당 최대 요청 수 (기본: 0, 제한 없음)")
+    parser.add_argument("--parse-processes", type=int, action="append",
+                        help="파싱 프로세스 수 (여러 번 지정 가능, 기본: 0 = 크롤링 스레드에서 파싱)")
+    parser.add_argument("--seed", type=int, default=1, help="오류/지연 난수 시드 (기본: 1)")
+    parser.add_argument("--json", help="결과를 JSON 파일로도 저장할 경로")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    server, base_url = start_server(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate, hang=15.0, seed=args.seed
+    )
+    http_client.set_base_url_override(base_url)
+    resilience.set_rate_limit(args.rate_limit)
+
+    results = []
+    try:
+        for agency in args.agency or list(SCRAPE_FUNCS):
+            default_workers = get_max_workers(BOARDS[agency].url)
+            for workers in args.workers or [1, default_workers]:
+                for processes in args.parse_processes or [0]:
+                    # 풀을 미리 만들어 두어 프로세스 시작 시간은 측정에서 뺍니다.
+                    set_parse_processes(processes)
+                    pool = get_parse_pool()
+                    if pool is not None:
+                        list(pool.map(abs, range(processes)))
+                    result = bench_agency(agency, workers, processes)
+                    results.append(result)
+                    print(
+                        f"{agency:<8} 동시 요청 {workers:>2}개, 파싱 프로세스 {processes:>2}개: "
+                        f"{result['seconds']:7.2f}초, {result['rows']:>5}건, "
+                        f"요청 {result['requests']:>4}회, 연결 {result['connections']:>3}개"
+                    )
+    finally:
+        http_client.set_base_url_override(None)
+        resilience.set_rate_limit(None)
+        set_parse_processes(0)
+        server.shutdown()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
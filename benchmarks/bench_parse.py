@@ -0,0 +1,140 @@
+"""
+기록해 둔 목록 페이지(benchmarks/fixtures/<기관>/page_*.html)로 각 크롤러의 parse_page 를
+네트워크 없이 실행하여 기관별, 파서 백엔드별 성능을 측정합니다.
+
+출력 항목: 초당 페이지 수, 초당 행 수, 1회 순회 시 최대 메모리(tracemalloc 기준),
+그리고 기준 백엔드(html.parser, 문서 전체 파싱)와 추출 결과가 같은지 여부.
+
+사용법 (저장소 최상위에서):
+    python benchmarks/bench_parse.py
+    python benchmarks/bench_parse.py --agency pps --repeat 50 --json bench_parse.json
+"""
+import os
+import sys
+import glob
+import json
+import time
+import logging
+import argparse
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+sys.path.insert(0, ROOT_DIR)
+
+import html_parsing  # noqa: E402
+from agencies import CRAWLER_MODULES  # noqa: E402
+
+# (이름, 파서, SoupStrainer 사용 여부). 첫 항목이 결과 비교 기준입니다.
+BACKENDS = [
+    ("html.parser", "html.parser", False),
+    ("html.parser+strainer", "html.parser", True),
+    ("lxml", "lxml", False),
+    ("lxml+strainer", "lxml", True),
+]
+
+
+def load_fixtures(agency):
+    """기관의 기록된 목록 페이지들을 [(페이지 번호, html)] 로 읽어 반환합니다."""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, agency, "page_*.html"))):
+        page = int(os.path.basename(path)[5:8])
+        with open(path, encoding="utf-8") as f:
+            pages.append((page, f.read()))
+    return pages
+
+
+def parse_all(module, pages):
+    results = []
+    for page, html in pages:
+        results.append(module.parse_page(html, page))
+    return results
+
+
+def bench_backend(module, pages, parser, strainer, repeat):
+    """한 백엔드로 pages 를 repeat 번 파싱하여 측정값과 마지막 파싱 결과를 반환합니다."""
+    html_parsing.PARSER = parser
+    html_parsing.USE_STRAINER = strainer
+
+    # 메모리는 측정 오버헤드가 크므로 한 번만 따로 잽니다.
+    tracemalloc.start()
+    records = parse_all(module, pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rows = sum(len(page_records) for page_records in records)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_all(module, pages)
+    elapsed = time.perf_counter() - start
+
+    page_count = len(pages) * repeat
+    return {
+        "pages_per_sec": page_count / elapsed if elapsed else 0.0,
+        "rows_per_sec": rows * repeat / elapsed if elapsed else 0.0,
+        "peak_memory_kb": peak / 1024,
+        "rows": rows,
+    }, records
+
+
+def run(agencies, repeat):
+    backends = [b for b in BACKENDS if b[1] != "lxml" or html_parsing.HAS_LXML]
+    saved = (html_parsing.PARSER, html_parsing.USE_STRAINER)
+    results = []
+    try:
+        for agency in agencies:
+            module = CRAWLER_MODULES[agency]
+            pages = load_fixtures(agency)
+            if not pages:
+                print(f"{agency}: 기록된 페이지가 없습니다. ({FIXTURE_DIR}/{agency})")
+                continue
+            baseline = None
+            for name, parser, strainer in backends:
+                stats, records = bench_backend(module, pages, parser, strainer, repeat)
+                if baseline is None:
+                    baseline = records
+                stats.update({
+                    "agency": agency,
+                    "backend": name,
+                    "pages": len(pages),
+                    "same_records": records == baseline,
+                })
+                results.append(stats)
+    finally:
+        html_parsing.PARSER, html_parsing.USE_STRAINER = saved
+    return results
+
+
+def print_table(results):
+    header = f"{'기관':<8}{'백엔드':<22}{'pages/s':>10}{'rows/s':>12}{'peak KB':>10}  결과"
+    print(header)
+    print("-" * 70)
+    for r in results:
+        same = "일치" if r["same_records"] else "불일치"
+        print(
+            f"{r['agency']:<8}{r['backend']:<22}{r['pages_per_sec']:>10.1f}"
+            f"{r['rows_per_sec']:>12.1f}{r['peak_memory_kb']:>10.1f}  {same}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 HTML로 크롤러 파싱 성능을 측정합니다.")
+    parser.add_argument("--agency", choices=sorted(CRAWLER_MODULES), action="append",
+                        help="측정할 기관 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--repeat", type=int, default=20, help="기관별 반복 횟수 (기본: 20)")
+    parser.add_argument("--json", help="결과를 JSON 파일로도 저장할 경로")
+    args = parser.parse_args()
+
+    # parse_page 가 페이지마다 남기는 INFO 로그는 측정에 방해되므로 끕니다.
+    logging.disable(logging.INFO)
+    results = run(args.agency or list(CRAWLER_MODULES), args.repeat)
+    print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if not all(r["same_records"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+기획재정부/국세청/관세청/조달청/통계청 목록 페이지를 흉내 내는 로컬 대역(stand-in) HTTP 서버입니다.
+benchmarks/fixtures 의 기록된 페이지를 각 기관의 실제 경로와 같은 경로로 돌려주므로,
+크롤러의 요청 주소만 이 서버로 바꾸면(http_client.set_base_url_override 또는 CRAWLER_BASE_URL)
+네트워크 없이 전체 크롤링을 재현할 수 있습니다.
+
+- 기획재정부, 조달청: GET pageIndex 파라미터
+- 국세청, 관세청: POST currPage 폼 파라미터
+- 통계청: POST nPage 폼 파라미터
+
+기록된 페이지가 없는 중간 페이지는 2페이지 기록의 게시글 번호를 그 페이지 번호만큼 옮겨(PAGE_IDS) 돌려주므로
+게시글 ID 가 페이지마다 다르고, 마지막 페이지 이후는 빈 목록 페이지를 돌려줍니다.
+GET 응답에는 본문 해시로 만든 ETag 를 붙이고, If-None-Match 가 같으면 304 Not Modified 로 답합니다.
+지연 시간, 오류율(HTTP 500), 응답 없음(타임아웃) 비율을 설정할 수 있으며,
+GET /__stats 로 지금까지 처리한 요청 수를 JSON 으로 확인할 수 있습니다.
+
+사용법 (저장소 최상위에서):
+    python benchmarks/stub_server.py --port 8765 --latency 0.05 --error-rate 0.02
+    CRAWLER_BASE_URL=http://127.0.0.1:8765 python crawler_pps.py
+"""
+import os
+import re
+import json
+import hashlib
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 경로별 (기관 키, 페이지 파라미터 이름, 마지막 페이지)
+ROUTES = {
+    "/nw/nes/nesdta.do": ("moef", "pageIndex", 80),
+    "/nts/na/ntt/selectNttList.do": ("nts", "currPage", 59),
+    "/kcs/na/ntt/selectNttList.do": ("customs", "currPage", 150),
+    "/kor/bbs/list.do": ("pps", "pageIndex", 175),
+    "/board.es": ("kostat", "nPage", 39),
+}
+
+# 기관별 (2페이지 기록에서 게시글 번호를 찾는 정규식, 한 페이지당 번호 간격).
+# 기록된 페이지들과 같이 페이지가 하나 넘어갈 때마다 번호가 간격만큼 줄어듭니다.
+# 국세청, 관세청의 상단 고정 공지(두 자리 번호)는 모든 페이지에 그대로 둡니다.
+PAGE_IDS = {
+    "moef": (re.compile(rb"(?<=MOSF_)\d{14}"), 10),
+    "nts": (re.compile(rb'(?<=data-id=")\d{4,}'), 10),
+    "customs": (re.compile(rb'(?<=data-id=")\d{4,}|(?<=T0)\d{6}'), 10),
+    "pps": (re.compile(rb"(?<=goView\(')\d+"), 10000),
+    "kostat": (re.compile(rb"(?<=list_no=)\d+"), 10),
+}
+
+
+def shift_page_ids(agency, body, page):
+    """2페이지 기록 body 의 게시글 번호를 page 페이지의 번호로 바꿉니다. (자릿수는 유지)"""
+    pattern, step = PAGE_IDS[agency]
+    offset = (page - 2) * step
+
+    def shift(match):
+        number = match.group()
+        return str(int(number) - offset).zfill(len(number)).encode("ascii")
+    return pattern.sub(shift, body)
+
+
+class StubConfig:
+    """서버 동작 설정과 요청 통계. 핸들러 스레드들이 함께 사용합니다."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, timeout_rate=0.0, hang=15.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang = hang
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.pages = {}
+
+    def count(self, agency, outcome):
+        with self.lock:
+            entry = self.stats.setdefault(agency, {"ok": 0, "not_modified": 0, "error": 0, "timeout": 0})
+            entry[outcome] += 1
+
+    def roll(self):
+        with self.lock:
+            return self.random.random(), self.random.uniform(-self.jitter, self.jitter)
+
+    def page_html(self, agency, page, last_page):
+        """기관의 page 번째 목록 페이지 HTML(bytes)을 반환합니다. 읽은 파일은 메모리에 보관합니다."""
+        if page > last_page:
+            page = last_page + 1
+        key = (agency, page)
+        with self.lock:
+            if key in self.pages:
+                return self.pages[key]
+        path = os.path.join(FIXTURE_DIR, agency, f"page_{page:03d}.html")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                body = f.read()
+        else:
+            with open(os.path.join(FIXTURE_DIR, agency, "page_002.html"), "rb") as f:
+                body = shift_page_ids(agency, f.read(), page)
+        with self.lock:
+            self.pages[key] = body
+        return body
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == "/__stats":
+            with self.config.lock:
+                body = json.dumps(self.config.stats).encode("utf-8")
+            self._send(200, body, "application/json")
+            return
+        self._serve(parsed.path, parse_qs(parsed.query))
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        params = parse_qs(parsed.query)
+        params.update(form)
+        self._serve(parsed.path, params)
+
+    def _serve(self, path, params):
+        route = ROUTES.get(path)
+        if route is None:
+            self._send(404, b"not found", "text/plain")
+            return
+        agency, page_param, last_page = route
+        try:
+            page = int(params.get(page_param, ["1"])[0])
+        except ValueError:
+            page = 1
+
+        roll, jitter = self.config.roll()
+        delay = max(0.0, self.config.latency + jitter)
+        if roll < self.config.timeout_rate:
+            # 클라이언트 타임아웃보다 길게 응답하지 않습니다.
+            self.config.count(agency, "timeout")
+            time.sleep(self.config.hang)
+            self.close_connection = True
+            return
+        time.sleep(delay)
+        if roll < self.config.timeout_rate + self.config.error_rate:
+            self.config.count(agency, "error")
+            self._send(500, b"internal server error", "text/plain")
+            return
+        body = self.config.page_html(agency, page, last_page)
+        if self.command != "GET":
+            self.config.count(agency, "ok")
+            self._send(200, body, "text/html; charset=UTF-8")
+            return
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.config.count(agency, "not_modified")
+            self._send(304, b"", None, {"ETag": etag})
+            return
+        self.config.count(agency, "ok")
+        self._send(200, body, "text/html; charset=UTF-8", {"ETag": etag})
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_server(host="127.0.0.1", port=0, **config):
+    """
+    대역 서버를 백그라운드 스레드에서 시작하고 (server, base_url) 을 반환합니다.
+    port=0 이면 빈 포트를 자동으로 고릅니다. config 는 StubConfig 의 인자입니다.
+    종료할 때는 server.shutdown() 을 호출합니다.
+    """
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"config": StubConfig(**config)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기관 목록 페이지 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연의 ± 변동 폭(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 응답 비율 (0~1)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="응답하지 않는 요청 비율 (0~1)")
+    parser.add_argument("--hang", type=float, default=15.0, help="응답하지 않을 때 기다리는 시간(초)")
+    parser.add_argument("--seed", type=int, help="오류/지연 난수 시드")
+    args = parser.parse_args()
+
+    server, base_url = start_server(
+        args.host, args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate, hang=args.hang, seed=args.seed
+    )
+    print(f"대역 서버 실행 중: {base_url} (종료: Ctrl+C)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
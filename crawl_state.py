@@ -0,0 +1,97 @@
+import time
+import logging
+import store
+import table_snapshot
+import http_client
+from agencies import ITER_FUNCS
+
+
+def crawl_incremental(agency, full=False, on_page=None):
+    """
+    저장소에 이미 있는 게시글 ID들을 known_ids 로 넘겨 새 게시글이 있는 앞쪽 페이지만 크롤링하고
+    받은 페이지의 게시글을 저장소에 upsert 합니다. 저장된 게시글이 없거나 full=True 이면 전체 페이지를 크롤링합니다.
+
+    - 저장소가 비어 있는 첫 크롤링은 페이지를 파싱할 때마다 바로 저장하므로
+      크롤링이 끝나기 전에도 앞 페이지 게시글을 읽을 수 있습니다.
+    - 이미 데이터가 있으면(갱신) 결과를 모아 두었다가 끝난 뒤 store.apply_snapshot 으로 한 번에 반영합니다.
+      갱신 중에는 이전 데이터가 그대로 제공되고(stale-while-revalidate), 실패하면 이전 데이터가 유지됩니다.
+      full=True 인 갱신은 게시판에서 사라진 게시글도 지웁니다.
+      이전 데이터와 게시글ID로 비교한 새 글과 제목이 바뀐 글(받은 페이지의 게시글 중), 그리고 전체 갱신이면
+      사라진 글은 저장소의 변경 기록(changes)에 덧붙습니다. (첫 크롤링은 비교할 이전 데이터가 없으므로 기록하지 않습니다.)
+      사라진 글을 지우는 것은 1페이지부터 마지막 페이지까지 모든 페이지에서 게시글을 받은 전체 갱신뿐입니다.
+      요청에 실패했거나 게시글이 없는(점검 안내, 오류 화면 등) 페이지가 있으면, 또는 게시판이
+      crawler_common.MAX_PAGES 보다 길어 뒤쪽 페이지를 크롤링하지 않았으면 아무것도 지우지 않습니다.
+      모든 페이지를 받은 전체 크롤링은(상한에 걸려 뒤쪽을 건너뛴 경우 포함) 그 시각을 crawl_status.full_snapshot_at 에
+      남깁니다. (워커가 사라진 글을 찾기 위한 전체 갱신 시기를 정할 때 씁니다.)
+
+    갱신할 때는 지난 크롤링의 목록 페이지별 결과(store.load_page_cache)를 넘겨, 바뀌지 않은 페이지는
+    조건부 요청과 내용 해시로 알아내 다시 파싱하지 않고 저장된 게시글을 씁니다.
+    갱신이 끝나면 화면이 빨리 시작할 수 있도록 기관과 전체 기관의 표 파일(table_snapshot)을 다시 씁니다.
+
+    on_page(page, records) 가 주어지면 페이지를 처리할 때마다 호출합니다.
+    진행 상황(크롤러가 찾은 마지막 페이지 total_pages 포함)과 데이터 기준 시각(snapshot_at)은 저장소의 crawl_status 에 기록되어
+    다른 프로세스(화면)에서도 볼 수 있습니다.
+    저장한 게시글 수를 반환합니다.
+    """
+    has_snapshot = store.count_records(agency) > 0
+    known_ids = store.known_ids(agency) if has_snapshot and not full else set()
+    last_page = None
+    truncated = False
+
+    def on_last_page(page, more_pages):
+        nonlocal last_page, truncated
+        last_page, truncated = page, more_pages
+        store.save_crawl_status(agency, total_pages=page)
+
+    page_cache = store.load_page_cache(agency)
+    pages = ITER_FUNCS[agency](known_ids=known_ids or None, on_last_page=on_last_page, page_cache=page_cache)
+    store.save_crawl_status(
+        agency, state="running", full=int(not known_ids), pages=0, rows=0, total_pages=None, error=None,
+        started_at=time.time(), finished_at=None
+    )
+
+    seq = store.new_crawl_seq()
+    count = 0
+    page_count = 0
+    filled_pages = set()
+    staged = []
+    try:
+        for page, records in pages:
+            if not has_snapshot:
+                if records:
+                    count += store.upsert_records(agency, records, seq=seq - count)
+            else:
+                staged.extend(records)
+                count = len(staged)
+            page_count += 1
+            if records:
+                filled_pages.add(page)
+            store.save_crawl_status(agency, pages=page_count, rows=count)
+            if on_page:
+                on_page(page, records)
+        # 게시글을 받지 못한 페이지가 있거나 마지막 페이지를 모르면 게시글이 잘못 지워지지 않도록 삭제는 하지 않습니다.
+        covered = not known_ids and last_page is not None and filled_pages.issuperset(range(1, last_page + 1))
+        complete = covered and not truncated
+        if covered and truncated:
+            logging.warning(
+                f"{agency} 게시판이 크롤링 상한({last_page}페이지)보다 길어 사라진 게시글은 확인하지 않습니다. "
+                f"(CRAWLER_MAX_PAGES 참고)"
+            )
+        if has_snapshot:
+            changes = store.apply_snapshot(agency, staged, seq=seq, replace=complete)
+            logging.info(
+                f"{agency} 변경: 새 게시글 {changes[store.CHANGE_NEW]}건, "
+                f"삭제 {changes[store.CHANGE_REMOVED]}건, 제목 변경 {changes[store.CHANGE_TITLE]}건"
+            )
+        store.save_page_cache(agency, page_cache.updated, last_page)
+    except Exception as e:
+        store.save_crawl_status(agency, state="error", error=str(e), finished_at=time.time())
+        raise
+    finished_at = time.time()
+    store.save_crawl_status(agency, state="done", finished_at=finished_at, snapshot_at=finished_at)
+    if covered:
+        store.save_crawl_status(agency, full_snapshot_at=finished_at)
+    table_snapshot.export_snapshots(agency)
+    logging.info(f"{agency} 저장소 갱신 완료: {count}건 저장")
+    logging.info(f"HTTP 연결 재사용 현황: {http_client.connection_stats()}")
+    return count
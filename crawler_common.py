@@ -0,0 +1,520 @@
+import os
+import re
+import time
+import hashlib
+import logging
+import datetime
+import threading
+import multiprocessing
+from collections import deque
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+
+import metrics
+import profiling
+import resilience
+from http_client import get_max_workers
+from records import RecordBatch
+
+# 기관별 등록일 표기(2025.07.08, 2025-07-08, 2025/7/8, 2025년 7월 8일 등)에서 연, 월, 일을 찾는 패턴
+DATE_PATTERN = re.compile(r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})")
+
+# 여는 태그 문자열에서 class 속성 값을 찾는 패턴 (list_area_html 참고)
+CLASS_ATTR_PATTERN = re.compile(r"""\bclass\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+
+# 게시판 기록을 최대 몇 페이지까지 거슬러 올라가 크롤링할지 (환경변수 CRAWLER_MAX_PAGES 로 변경 가능)
+# 실제 크롤링 범위는 1페이지의 페이지 이동 링크에서 찾은 마지막 페이지와 이 값 중 작은 쪽입니다.
+MAX_PAGES = int(os.environ.get("CRAWLER_MAX_PAGES", "300"))
+
+# 페이지 파싱에 쓸 프로세스 수. 0 이면 파싱을 크롤링 스레드에서 하고, 1 이상이면 모든 기관이 함께 쓰는
+# 프로세스 풀로 보내 여러 코어에서 파싱합니다. (환경변수 CRAWLER_PARSE_PROCESSES 또는 set_parse_processes)
+PARSE_PROCESSES = int(os.environ.get("CRAWLER_PARSE_PROCESSES", "0"))
+
+def fetch_in_order(fetch_page, pages, max_workers=1):
+    """
+    pages 를 fetch_page(page) 로 가져오면서 (page, html) 을 페이지 순서대로 yield 합니다.
+
+    max_workers 가 2 이상이면 스레드 풀로 요청을 동시에 보내되, 아직 소비되지 않은 요청은
+    max_workers 의 두 배까지만 미리 보내므로 받아 둔 HTML 이 한꺼번에 쌓이지 않습니다.
+    소비를 중간에 멈추면(generator close) 아직 시작하지 않은 요청은 취소됩니다.
+    """
+    if max_workers <= 1:
+        for page in pages:
+            yield page, fetch_page(page)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    page_iter = iter(pages)
+    window = deque()
+    try:
+        for page in islice(page_iter, max_workers * 2):
+            window.append((page, executor.submit(fetch_page, page)))
+        while window:
+            page, future = window.popleft()
+            html = future.result()
+            next_page = next(page_iter, None)
+            if next_page is not None:
+                window.append((next_page, executor.submit(fetch_page, next_page)))
+            yield page, html
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def set_parse_processes(processes):
+    """파싱 프로세스 수를 바꿉니다. (0 이면 프로세스 풀을 쓰지 않음) 이미 만든 풀은 닫고 필요할 때 새로 만듭니다."""
+    global PARSE_PROCESSES, _parse_pool
+    with _parse_pool_lock:
+        PARSE_PROCESSES = max(0, int(processes))
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
+
+
+def get_parse_pool():
+    """파싱 프로세스 풀을 반환합니다. PARSE_PROCESSES 가 0 이면 None 입니다."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if PARSE_PROCESSES and _parse_pool is None:
+            # 크롤링 스레드가 도는 중에 fork 하지 않도록 새 인터프리터(spawn)로 시작하고,
+            # 부모 프로세스에서 꺼 둔 로그 수준(logging.disable)은 자식에서도 끕니다.
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn"),
+                initializer=logging.disable, initargs=(logging.root.manager.disable,)
+            )
+        return _parse_pool
+
+
+def instrument_fetch(fetch_page, label):
+    """
+    fetch_page 를 감싸 페이지마다 요청 시간(재시도 포함)과 실패한 페이지 수를 label 의 지표로 기록합니다.
+    감싼 함수는 스레드 풀에서 호출되어도 됩니다.
+    """
+    def fetch(page):
+        start = time.perf_counter()
+        html = fetch_page(page)
+        metrics.observe("page_fetch_seconds", label, time.perf_counter() - start)
+        metrics.inc("pages", label)
+        if html is None:
+            metrics.inc("failed_pages", label)
+        return html
+    return fetch
+
+
+class UnchangedPage:
+    """지난 크롤링 때와 같은 목록 페이지. 파싱하지 않고 저장된 게시글(records)을 그대로 씁니다."""
+    __slots__ = ("records",)
+
+    def __init__(self, records):
+        self.records = records
+
+
+class PageCache:
+    """
+    기관 목록 페이지별 지난 크롤링 결과입니다. 페이지마다 (내용 해시, ETag, Last-Modified, 게시글 ID 리스트) 를
+    entries 에 담고, 게시글은 처음 필요할 때 load_records() 로 {게시글 ID: Announcement} 를 한 번 읽어 씁니다.
+    이번 크롤링에서 확인한 페이지의 새 항목은 updated 에 모이며, 크롤링이 끝나면 저장소에 반영합니다.
+    (store.load_page_cache, store.save_page_cache 참고)
+    """
+
+    def __init__(self, entries=None, load_records=None):
+        self.entries = entries or {}
+        self.updated = {}
+        self._load_records = load_records
+        self._records = None
+        self._fetched = {}
+        self._lock = threading.Lock()
+
+    def validators(self, page):
+        """페이지의 조건부 요청 검증 값 (ETag, Last-Modified) 을 반환합니다."""
+        entry = self.entries.get(page)
+        return (entry[1], entry[2]) if entry else (None, None)
+
+    def cached_records(self, page, content_hash=None):
+        """
+        페이지의 저장된 게시글 리스트를 반환합니다. content_hash 가 주어지면 저장된 해시와 같을 때만 반환합니다.
+        항목이 없거나 게시글 일부가 저장소에 없으면 None 을 반환합니다.
+        """
+        entry = self.entries.get(page)
+        if entry is None or (content_hash is not None and entry[0] != content_hash):
+            return None
+        with self._lock:
+            if self._records is None:
+                self._records = self._load_records() if self._load_records else {}
+        try:
+            return [self._records[post_id] for post_id in entry[3]]
+        except KeyError:
+            return None
+
+    def remember_fetch(self, page, content_hash, etag, last_modified):
+        with self._lock:
+            self._fetched[page] = (content_hash, etag, last_modified)
+
+    def remember_records(self, page, records):
+        """페이지를 받아 게시글을 얻은 뒤 호출합니다. 받은 페이지의 검증 값과 게시글 ID 를 updated 에 남깁니다."""
+        with self._lock:
+            fetched = self._fetched.pop(page, None)
+            if fetched is not None:
+                self.updated[page] = (*fetched, [record_id(record) for record in records])
+
+
+def list_area_html(html, list_area):
+    """
+    html 에서 list_area((태그 이름, class)) 에 맞는 첫 요소를 여는 태그부터 짝이 맞는 닫는 태그까지 잘라 반환합니다.
+    class 는 공백으로 구분한 값이 모두 있으면 맞는 것으로 봅니다. 트리를 만들지 않고 같은 이름의 태그만 세며,
+    찾지 못하면 None 을 반환합니다.
+    """
+    name, class_ = list_area
+    classes = set(class_.split())
+    tags = re.compile(rf"<(/?){name}\b[^>]*>", re.IGNORECASE)
+    for match in tags.finditer(html):
+        attr = CLASS_ATTR_PATTERN.search(match.group())
+        if not match.group(1) and attr and classes <= set(attr.group(1).split()):
+            break
+    else:
+        return None
+    depth = 0
+    for tag in tags.finditer(html, match.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return html[match.start():tag.end()]
+    return None
+
+
+def cached_fetch(fetch_page, page_cache, label, list_area=None):
+    """
+    fetch_page 를 감싸 page_cache 에 있는 지난 결과로 바뀌지 않은 페이지를 알아냅니다.
+
+    - GET 으로 받는 페이지는 지난번 ETag/Last-Modified 로 조건부 요청을 보내고, 304 이면 본문을 받지 않습니다.
+    - 받은 HTML 의 내용 해시가 지난번과 같아도 바뀌지 않은 것으로 봅니다. (POST 로 받는 게시판 포함)
+      list_area 가 주어지면 문서 전체가 아니라 목록 영역(list_area_html)만 해시하므로, 요청마다 바뀌는
+      보안 토큰, 세션 ID, 배너 같은 페이지 바깥 부분 때문에 바뀐 페이지로 보지 않습니다.
+    바뀌지 않은 페이지는 UnchangedPage(저장된 게시글) 를, 그 밖에는 HTML 을 반환하므로 파싱을 건너뛸 수 있습니다.
+    1페이지는 가장 자주 바뀌고 마지막 페이지를 찾는 데도 쓰므로 항상 그대로 받습니다.
+    """
+    def fetch(page):
+        if page == 1:
+            return fetch_page(page)
+        etag, last_modified = page_cache.validators(page)
+        with resilience.conditional(etag, last_modified) as validators:
+            html = fetch_page(page)
+        if html is not None and validators.not_modified:
+            records = page_cache.cached_records(page)
+            if records is not None:
+                metrics.inc("unchanged_pages", label)
+                page_cache.remember_fetch(page, page_cache.entries[page][0], validators.etag, validators.last_modified)
+                return UnchangedPage(records)
+            # 304 를 받았지만 저장된 게시글이 없으면 조건 없이 다시 받습니다.
+            with resilience.conditional() as validators:
+                html = fetch_page(page)
+        if html is None:
+            return None
+
+        area = list_area_html(html, list_area) if list_area else None
+        content_hash = hashlib.sha1((html if area is None else area).encode("utf-8")).hexdigest()
+        page_cache.remember_fetch(page, content_hash, validators.etag, validators.last_modified)
+        records = page_cache.cached_records(page, content_hash)
+        if records is not None:
+            metrics.inc("unchanged_pages", label)
+            return UnchangedPage(records)
+        return html
+    return fetch
+
+
+def _record_parse_metrics(label, elapsed, row_count):
+    metrics.observe("parse_seconds", label, elapsed)
+    metrics.observe("rows_per_page", label, row_count)
+    metrics.inc("rows", label, row_count)
+
+
+def parse_with_metrics(parse_page, html, page, label):
+    """
+    parse_page(html, page) 를 호출하고 파싱 시간과 페이지당 게시글 수를 label 의 지표로 기록합니다.
+    html 이 UnchangedPage 이면 파싱하지 않고 저장된 게시글을 반환합니다.
+    """
+    if isinstance(html, UnchangedPage):
+        return html.records
+    start = time.perf_counter()
+    records = parse_page(html, page)
+    _record_parse_metrics(label, time.perf_counter() - start, len(records))
+    return records
+
+
+def _parse_to_batch(parse_page, html, page):
+    """파싱 프로세스에서 실행됩니다. 게시글을 열 단위(RecordBatch)로 묶어 파싱 시간과 함께 돌려줍니다."""
+    start = time.perf_counter()
+    records = parse_page(html, page)
+    return RecordBatch.from_records(records), time.perf_counter() - start
+
+
+def parse_in_order(parse_page, fetched, label=""):
+    """
+    fetch_in_order 가 내놓는 (page, html) 들을 parse_page 로 파싱해 (page, 게시글 리스트) 를 페이지 순서대로 yield 합니다.
+    html 이 None 인(요청에 실패한) 페이지는 (page, None) 을 yield 합니다.
+
+    파싱 프로세스 풀(get_parse_pool)이 있으면 앞선 페이지의 결과를 기다리는 동안 다음 페이지들을 미리 보내
+    여러 프로세스가 함께 파싱합니다. 프로세스로는 HTML 문자열을 보내고 게시글은 열 단위(RecordBatch)로 받으므로
+    게시글마다 객체를 직렬화하지 않습니다. 풀이 없거나 프로파일링 중이면(자식 프로세스는 측정되지 않으므로)
+    호출 스레드에서 파싱합니다.
+    """
+    pool = None if profiling.enabled() else get_parse_pool()
+    if pool is None:
+        for page, html in fetched:
+            yield page, None if html is None else parse_with_metrics(parse_page, html, page, label)
+        return
+
+    window = deque()
+    try:
+        for page, html in fetched:
+            if html is not None and not isinstance(html, UnchangedPage):
+                html = pool.submit(_parse_to_batch, parse_page, html, page)
+            window.append((page, html))
+            if len(window) > PARSE_PROCESSES * 2:
+                yield _collect_parsed(window.popleft(), label)
+        while window:
+            yield _collect_parsed(window.popleft(), label)
+    finally:
+        for _, future in window:
+            if isinstance(future, Future):
+                future.cancel()
+        fetched.close()
+
+
+def _collect_parsed(item, label):
+    page, future = item
+    if future is None:
+        return page, None
+    if isinstance(future, UnchangedPage):
+        return page, future.records
+    batch, elapsed = future.result()
+    _record_parse_metrics(label, elapsed, len(batch))
+    return page, batch.to_records()
+
+
+def find_last_page(html, page_pattern):
+    """
+    목록 페이지 HTML의 페이지 이동 링크에서 page_pattern(페이지 번호를 첫 그룹으로 잡는 정규식)으로 찾은
+    가장 큰 페이지 번호, 즉 게시판의 마지막 페이지를 반환합니다. 찾지 못하면 None 을 반환합니다.
+    크롤링할 페이지 수의 상한(max_pages)은 호출하는 쪽에서 적용합니다.
+    """
+    if not html or page_pattern is None:
+        return None
+    numbers = [int(number) for number in page_pattern.findall(html)]
+    if not numbers:
+        return None
+    return max(numbers)
+
+
+def iter_pages(fetch_page, parse_page, page_pattern=None, max_pages=None, max_workers=1, label="",
+               known_ids=None, on_last_page=None, page_cache=None, list_area=None):
+    """
+    1페이지부터 게시판의 마지막 페이지까지 각 페이지를 fetch_page(page) 로 가져와 parse_page(html, page) 로 파싱하면서
+    (page, 게시글 리스트) 를 페이지 순서대로 yield 합니다.
+
+    - 마지막 페이지는 1페이지의 페이지 이동 링크에서 page_pattern 으로 찾습니다. (find_last_page 참고)
+      찾지 못하면 게시글이 없는 첫 페이지의 앞 페이지를 마지막 페이지로 봅니다.
+      어느 쪽이든 max_pages(기본 MAX_PAGES) 페이지를 넘지 않으며, 알게 되면 on_last_page(마지막 페이지, truncated) 를
+      호출합니다. truncated 는 게시판이 max_pages 보다 길어 뒤쪽 페이지를 크롤링하지 않는다는 뜻입니다.
+      (이때 크롤링 결과에 없는 게시글을 삭제된 글로 보면 안 됩니다. crawl_state.crawl_incremental 참고)
+    - 1페이지를 받은 뒤 max_workers 가 2 이상이면 나머지 페이지는 최대 max_workers 개의 요청을 동시에 보냅니다.
+      파싱은 호출 스레드(PARSE_PROCESSES 가 1 이상이면 파싱 프로세스 풀)에서 하고 결과는 페이지 순서대로 내놓으므로
+      결과 순서는 순차 크롤링과 같습니다. 프로파일링 중에는 동시 요청 수가 profiling.limit_workers 를 따릅니다.
+    - fetch_page 가 None 을 반환한 페이지는 건너뜁니다.
+    - known_ids 가 주어지면 iter_pages_incremental 로 새 게시글이 있는 앞쪽 페이지만 크롤링합니다.
+    - page_cache(PageCache)가 주어지면 지난 크롤링 때와 같은 페이지는 파싱하지 않고 저장된 게시글을 씁니다.
+      (cached_fetch 참고, 내용 해시는 list_area 가 있으면 목록 영역만) 이번에 받은 페이지의 검증 값과 게시글 ID 는
+      page_cache.updated 에 남습니다.
+    - 페이지 요청 시간, 파싱 시간, 페이지당 게시글 수는 label 별로 metrics 에 기록됩니다.
+    """
+    max_pages = MAX_PAGES if max_pages is None else max_pages
+    max_workers = profiling.limit_workers(max_workers)
+    if known_ids is not None:
+        yield from iter_pages_incremental(
+            fetch_page, parse_page, known_ids, page_pattern, max_pages, max_workers, label, on_last_page, page_cache,
+            list_area
+        )
+        return
+
+    if page_cache is not None:
+        fetch_page = cached_fetch(fetch_page, page_cache, label, list_area)
+    fetch_page = instrument_fetch(fetch_page, label)
+    page_count = 1
+    row_count = 0
+    start = time.perf_counter()
+    html = fetch_page(1)
+    board_last_page = find_last_page(html, page_pattern)
+    last_page = None if board_last_page is None else min(board_last_page, max_pages)
+    if html is not None:
+        records = parse_with_metrics(parse_page, html, 1, label)
+        row_count += len(records)
+        if not records and last_page is None:
+            last_page = 0
+        yield 1, records
+
+    if last_page is not None and on_last_page:
+        on_last_page(last_page, board_last_page is not None and board_last_page > max_pages)
+    fetched = fetch_in_order(fetch_page, range(2, (last_page or max_pages) + 1), max_workers)
+    for page, records in parse_in_order(parse_page, fetched, label):
+        page_count += 1
+        if records is None:
+            continue
+        if not records and last_page is None:
+            # 페이지 이동 링크를 찾지 못했으면 게시글이 없는 첫 페이지에서 멈춥니다.
+            last_page = page - 1
+            if on_last_page:
+                on_last_page(last_page, False)
+            break
+        row_count += len(records)
+        if page_cache is not None:
+            page_cache.remember_records(page, records)
+        yield page, records
+
+    elapsed = time.perf_counter() - start
+    logging.info(
+        f"{label} {page_count}개 페이지 크롤링 완료: {row_count}건, "
+        f"{elapsed:.1f}초 소요 (동시 요청 {max_workers}개)"
+    )
+
+
+class Board:
+    """
+    기관 공지사항 게시판 하나입니다. (agencies.BOARDS 참고)
+    label 은 로그와 지표에 쓰는 기관 이름, url 은 동시 요청 수(http_client.get_max_workers)를 정하는 목록 주소이고,
+    크롤러 모듈(module)은 다음을 가집니다.
+
+    - fetch_page(page): page 번째 목록 페이지의 HTML 문자열을 반환합니다. 실패한 요청은 공통 재시도 정책
+      (resilience.request)으로 다시 시도하며, 끝내 실패하면 None 을 반환합니다.
+    - parse_page(html, page): 목록 페이지 HTML 에서 게시글(records.Announcement) 리스트를 추출합니다.
+    - PAGE_PATTERN: 페이지 이동 링크에서 페이지 번호를 첫 그룹으로 잡는 정규식입니다.
+      1페이지에서 찾은 가장 큰 번호를 마지막 페이지로 봅니다. (find_last_page 참고)
+    - LIST_AREA: 게시글 목록을 담은 요소의 (태그 이름, class) 입니다. parse_page 는 이 영역만 파싱하고(make_soup),
+      바뀌지 않은 페이지를 알아낼 때는 이 영역만 해시합니다. (cached_fetch 참고)
+    """
+    __slots__ = ("label", "url", "module")
+
+    def __init__(self, label, url, module):
+        self.label = label
+        self.url = url
+        self.module = module
+
+
+def iter_board(board, max_workers=None, known_ids=None, on_last_page=None, page_cache=None):
+    """
+    board 게시판을 iter_pages 로 크롤링하며 (페이지 번호, 게시글 리스트) 를 페이지 순서대로 yield 합니다.
+
+    - max_workers: 동시 요청 수 (None 이면 board.url 호스트의 http_client.HOST_MAX_WORKERS 설정을 따름)
+    - known_ids: 이미 수집한 게시글 ID 집합. 주어지면 새 게시글이 있는 앞쪽 페이지만 증분 크롤링합니다.
+      (iter_pages_incremental 참고)
+    - on_last_page, page_cache: iter_pages 와 같습니다.
+    """
+    module = board.module
+    return iter_pages(
+        module.fetch_page, module.parse_page, module.PAGE_PATTERN,
+        max_workers=get_max_workers(board.url, max_workers), label=board.label,
+        known_ids=known_ids, on_last_page=on_last_page, page_cache=page_cache, list_area=module.LIST_AREA
+    )
+
+
+def scrape_board(board, max_workers=None, known_ids=None):
+    """iter_board 의 게시글을 페이지 순서대로 이어 붙인 리스트를 반환합니다. 인자는 iter_board 와 같습니다."""
+    results = []
+    for _, records in iter_board(board, max_workers, known_ids):
+        results.extend(records)
+    return results
+
+
+def record_id(record):
+    """
+    게시글의 고유 ID를 반환합니다.
+    크롤러가 추출한 게시글ID(post_id)가 없으면 링크, 그것도 없으면 제목과 등록일을 사용합니다.
+    """
+    return record.post_id or record.link or f"{record.title}|{record.reg_date}"
+
+
+def normalize_date(text):
+    """
+    기관마다 다른 등록일 문자열을 정렬 가능한 "YYYY-MM-DD" 형식으로 바꿉니다.
+    날짜를 찾을 수 없거나 올바르지 않은 날짜이면 빈 문자열을 반환합니다.
+    """
+    match = DATE_PATTERN.search(text or "")
+    if not match:
+        return ""
+    year, month, day = (int(value) for value in match.groups())
+    try:
+        return datetime.date(year, month, day).isoformat()
+    except ValueError:
+        return ""
+
+
+def iter_pages_incremental(fetch_page, parse_page, known_ids, page_pattern=None, max_pages=None, max_workers=1,
+                           label="", on_last_page=None, page_cache=None, list_area=None):
+    """
+    iter_pages 의 증분 버전입니다. 받은 페이지의 게시글을 모두 (page, 게시글 리스트) 로 페이지 순서대로 yield 하므로
+    호출하는 쪽에서 이미 알려진 게시글의 제목이 바뀐 것도 알 수 있습니다. (store.apply_snapshot 참고)
+    멈출 때는 known_ids 에 없는 새 ID 만 보아, 새 ID 가 하나도 없는 페이지를 만나면 더 이상 페이지를 넘기지 않습니다.
+    (상단 고정 공지가 매 페이지에 반복되므로 "알려진 ID가 하나라도 있는 페이지"가 아니라
+    "알려진 ID이거나 앞 페이지에서 이미 본 ID만 있는 페이지"에서 멈춥니다. 그래서 새 고정 공지가 있어도
+    그 공지가 처음 나온 페이지 다음부터는 반복된 공지 때문에 계속 넘어가지 않습니다.)
+    마지막 페이지는 iter_pages 와 같이 1페이지의 페이지 이동 링크로 찾고, 찾지 못하면 게시글이 없는 첫 페이지에서 멈춥니다.
+    page_cache, list_area 도 iter_pages 와 같이 사용합니다.
+
+    첫 요청은 1페이지만 보내고, 새 글이 계속 나오면 한 번에 요청하는 페이지 수를
+    max_workers 까지 두 배씩 늘려 평소 갱신은 한두 페이지로 끝나도록 합니다.
+    """
+    last_page = MAX_PAGES if max_pages is None else max_pages
+    discovered = False
+    known_ids = set(known_ids)
+    if page_cache is not None:
+        fetch_page = cached_fetch(fetch_page, page_cache, label, list_area)
+    fetch_page = instrument_fetch(fetch_page, label)
+    seen = set()
+    fetched_pages = 0
+    new_count = 0
+    batch_size = 1
+    next_page = 1
+    stopped = False
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while next_page <= last_page and not stopped:
+            batch = range(next_page, min(next_page + batch_size, last_page + 1))
+            for page, html in zip(batch, executor.map(fetch_page, batch)):
+                fetched_pages += 1
+                if html is None:
+                    continue
+                if page == 1:
+                    found = find_last_page(html, page_pattern)
+                    if found is not None:
+                        truncated = found > last_page
+                        last_page, discovered = min(found, last_page), True
+                        if on_last_page:
+                            on_last_page(last_page, truncated)
+                records = parse_with_metrics(parse_page, html, page, label)
+                if not records and not discovered:
+                    stopped = True
+                    break
+                if page_cache is not None:
+                    page_cache.remember_records(page, records)
+                new_ids = set()
+                for record in records:
+                    rid = record_id(record)
+                    if rid not in known_ids and rid not in seen:
+                        new_ids.add(rid)
+                seen.update(new_ids)
+                new_count += len(new_ids)
+                yield page, records
+                # 새 ID 가 없다는 것은 이 페이지의 모든 ID 가 known_ids 에 있거나 앞 페이지에서 본 것이라는 뜻입니다.
+                if records and not new_ids:
+                    stopped = True
+                    break
+            next_page += len(batch)
+            batch_size = min(batch_size * 2, max(1, max_workers))
+
+    elapsed = time.perf_counter() - start
+    logging.info(
+        f"{label} 증분 크롤링 완료: {fetched_pages}개 페이지 요청, 새 게시글 {new_count}건, "
+        f"{elapsed:.1f}초 소요"
+    )
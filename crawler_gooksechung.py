@@ -1,15 +1,60 @@
 # crawler_gooksechung.py
+import re
 import requests
 import logging
-from bs4 import BeautifulSoup
+import resilience
+from html_parsing import make_soup
+from records import Announcement
 from stqdm import stqdm  # stqdm 임포트
 
+URL = "https://www.nts.go.kr/nts/na/ntt/selectNttList.do"
+PAGE_PATTERN = re.compile(r"currPage=(\d+)")
+LIST_AREA = ("div", "bbs_ListA")
+
+# 폼에 포함되어 있는 모든 파라미터
+PAYLOAD_COMMON = {
+    "listUseAt": "Y",
+    "manageAt": "N",
+    "confmUseAt": "N",
+    "transIp": "https://doc.nts.go.kr:8080",
+    "bbsTy": "NORMAL",
+    "newHour": "24",
+    "maxSn": "10",
+    "authorAt": "N",
+    "noticeAt": "Y",
+    "synapViewerAt": "Y",
+    "mi": "2207",
+    "filepathIp": "http://www.nts.go.kr",
+    "useAt": "Y",
+    "minSn": "0",
+    "bbsId": "1011"
+}
+
+# User-Agent 등 공통 헤더는 http_client.DEFAULT_HEADERS 에서 채워집니다.
+HEADERS = {
+    # Referer를 지정하면 정상적인 페이지 로딩에 도움이 될 수 있습니다.
+    "Referer": "https://www.nts.go.kr/nts/na/ntt/selectNttList.do?mi=2207&bbsId=1011"
+}
+
+
+def fetch_page(page):
+    """
+    국세청 목록 페이지를 POST로 요청하여 HTML 문자열을 반환합니다.
+    """
+    # 페이지 번호를 포함한 폼 데이터 준비
+    payload = PAYLOAD_COMMON.copy()
+    payload["currPage"] = str(page)
+
+    try:
+        return resilience.request("POST", URL, data=payload, headers=HEADERS, timeout=10).text
+    except requests.exceptions.RequestException as e:
+        logging.error(f"페이지 {page} 에서 에러 발생: {e}")
+        return None
+
 
-def scrape_nts_data():
+def parse_page(html, page):
     """
-    https://www.nts.go.kr/nts/na/ntt/selectNttList.do 페이지에서
-    1페이지부터 59페이지까지 크롤링하여 각 공지사항의 제목, 작성일자, 링크를
-    딕셔너리 형태의 리스트로 반환합니다.
+    국세청 목록 페이지 HTML에서 공지사항의 제목, 작성일자, 링크를 추출합니다.
 
     - 제목: <td data-table="subject" class="bbs_tit"> 내부의 <a> 태그의 title 속성
     - 작성일자: <td data-table="date">의 텍스트
@@ -17,102 +62,59 @@ def scrape_nts_data():
       "https://nts.go.kr/nts/na/ntt/selectNttInfo.do?nttSn={data_id}&mi=2207" 형태로 생성
     """
     data_list = []
-    url = "https://www.nts.go.kr/nts/na/ntt/selectNttList.do"
-
-    # 폼에 포함되어 있는 모든 파라미터
-    payload_common = {
-        "listUseAt": "Y",
-        "manageAt": "N",
-        "confmUseAt": "N",
-        "transIp": "https://doc.nts.go.kr:8080",
-        "bbsTy": "NORMAL",
-        "newHour": "24",
-        "maxSn": "10",
-        "authorAt": "N",
-        "noticeAt": "Y",
-        "synapViewerAt": "Y",
-        "mi": "2207",
-        "filepathIp": "http://www.nts.go.kr",
-        "useAt": "Y",
-        "minSn": "0",
-        "bbsId": "1011"
-    }
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
-        ),
-        # Referer를 지정하면 정상적인 페이지 로딩에 도움이 될 수 있습니다.
-        "Referer": "https://www.nts.go.kr/nts/na/ntt/selectNttList.do?mi=2207&bbsId=1011"
-    }
-
-    # 1페이지부터 59페이지까지 순회
-    for page in range(1, 60):
-        # 페이지 번호를 포함한 폼 데이터 준비
-        payload = payload_common.copy()
-        payload["currPage"] = str(page)
-
-        response = requests.post(url, data=payload, headers=headers)
-        if response.status_code != 200:
-            logging.error(f"페이지 {page} 에서 에러 발생: {e}")
-            continue
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # 페이지 내 게시판 리스트가 들어 있는 컨테이너 (div.bbs_ListA)
-        container = soup.find("div", class_="bbs_ListA")
-        if not container:
-            logging.info(f"페이지 {page} 에서 게시판 리스트 영역을 찾을 수 없습니다.")
-            continue
-
-        table = container.find("table")
-        if not table:
-            logging.info(f"페이지 {page} 에서 table 영역을 찾을 수 없습니다.")
-            continue
-
-        tbody = table.find("tbody")
-        if not tbody:
-            logging.info(f"페이지 {page} 에서 tbody 영역을 찾을 수 없습니다.")
-            continue
-
-        rows = tbody.find_all("tr")
-        if not rows:
-            logging.info(f"페이지 {page} 에서 게시글을 찾을 수 없습니다.")
-            continue
-
-        for row in rows:
-            # 제목과 링크 추출: <td data-table="subject" class="bbs_tit">
-            subject_td = row.find("td", {"data-table": "subject", "class": "bbs_tit"})
-            if subject_td:
-                a_tag = subject_td.find("a", class_="nttInfoBtn")
-                if a_tag:
-                    title = a_tag.get("title", "").strip()
-                    data_id = a_tag.get("data-id", "").strip()
-                    link = f"https://nts.go.kr/nts/na/ntt/selectNttInfo.do?nttSn={data_id}&mi=2207" if data_id else ""
-                else:
-                    title, link = "", ""
+    soup = make_soup(html, LIST_AREA[0], class_=LIST_AREA[1])
+
+    # 페이지 내 게시판 리스트가 들어 있는 컨테이너 (div.bbs_ListA)
+    container = soup.find(LIST_AREA[0], class_=LIST_AREA[1])
+    if not container:
+        logging.info(f"페이지 {page} 에서 게시판 리스트 영역을 찾을 수 없습니다.")
+        return data_list
+
+    table = container.find("table")
+    if not table:
+        logging.info(f"페이지 {page} 에서 table 영역을 찾을 수 없습니다.")
+        return data_list
+
+    tbody = table.find("tbody")
+    if not tbody:
+        logging.info(f"페이지 {page} 에서 tbody 영역을 찾을 수 없습니다.")
+        return data_list
+
+    rows = tbody.find_all("tr")
+    if not rows:
+        logging.info(f"페이지 {page} 에서 게시글을 찾을 수 없습니다.")
+        return data_list
+
+    for row in rows:
+        # 제목과 링크 추출: <td data-table="subject" class="bbs_tit">
+        subject_td = row.find("td", {"data-table": "subject", "class": "bbs_tit"})
+        if subject_td:
+            a_tag = subject_td.find("a", class_="nttInfoBtn")
+            if a_tag:
+                title = a_tag.get("title", "").strip()
+                data_id = a_tag.get("data-id", "").strip()
+                link = f"https://nts.go.kr/nts/na/ntt/selectNttInfo.do?nttSn={data_id}&mi=2207" if data_id else ""
             else:
-                title, link = "", ""
-
-            # 작성일자 추출: <td data-table="date">
-            date_td = row.find("td", {"data-table": "date"})
-            date_text = date_td.get_text(strip=True) if date_td else ""
-
-            if title:
-                data_list.append({
-                    "제목": title,
-                    "등록일": date_text,
-                    "링크": link
-                })
-
-        logging.info(f"국세청 페이지 {page} 크롤링 완료, {len(rows)}개 행 처리됨.")
-
+                title, link, data_id = "", "", ""
+        else:
+            title, link, data_id = "", "", ""
+
+        # 작성일자 추출: <td data-table="date">
+        date_td = row.find("td", {"data-table": "date"})
+        date_text = date_td.get_text(strip=True) if date_td else ""
+
+        if title:
+            data_list.append(Announcement(
+                title=title,
+                reg_date=date_text,
+                link=link,
+                post_id=data_id
+            ))
+
+    logging.info(f"국세청 페이지 {page} 크롤링 완료, {len(rows)}개 행 처리됨.")
     return data_list
 
 
 if __name__ == "__main__":
-    results = scrape_nts_data()
-    print(f"총 항목 수: {len(results)}")
-    for item in results[:5]:
-        print(item)
+    import agencies
+    agencies.main("nts")
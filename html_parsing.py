@@ -0,0 +1,30 @@
+import os
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (설치되어 있으면 C 기반 파서를 사용)
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# 사용할 BeautifulSoup 파서. 환경변수 CRAWLER_HTML_PARSER 로 "html.parser" 또는 "lxml" 을 고를 수 있으며,
+# 지정하지 않으면 lxml 이 설치된 경우 lxml, 아니면 표준 라이브러리 html.parser 를 사용합니다.
+PARSER = os.environ.get("CRAWLER_HTML_PARSER") or ("lxml" if HAS_LXML else "html.parser")
+
+# 각 크롤러가 실제로 읽는 목록 영역은 페이지 전체의 일부이므로, 기본으로 그 영역만 트리로 만듭니다.
+# 비교를 위해 CRAWLER_HTML_STRAINER=0 으로 끄면 예전처럼 문서 전체를 파싱합니다.
+USE_STRAINER = os.environ.get("CRAWLER_HTML_STRAINER", "1") != "0"
+
+
+def make_soup(html, name, parser=None, **attrs):
+    """
+    html 에서 name/attrs 에 맞는 목록 영역만 파싱한 BeautifulSoup 객체를 반환합니다.
+    (SoupStrainer 로 그 밖의 태그는 트리를 만들지 않습니다.)
+
+    반환된 soup 에서 기존과 같이 soup.find(name, ...) 로 영역을 찾으면 됩니다.
+    parser 를 지정하지 않으면 PARSER 설정을 따릅니다.
+    """
+    parser = parser or PARSER
+    if not USE_STRAINER:
+        return BeautifulSoup(html, parser)
+    return BeautifulSoup(html, parser, parse_only=SoupStrainer(name, **attrs))
@@ -0,0 +1,142 @@
+import os
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 모든 크롤러가 공통으로 보내는 기본 헤더. 기관별 Referer 등은 요청 시 headers 로 덧붙입니다.
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
+    )
+}
+
+# 호스트(기관)별 동시 요청 수. 기관 서버 부하를 고려해 보수적으로 잡았습니다.
+# 환경변수 CRAWLER_MAX_WORKERS 로 목록에 없는 호스트의 기본값을 바꿀 수 있습니다.
+DEFAULT_MAX_WORKERS = int(os.environ.get("CRAWLER_MAX_WORKERS", "4"))
+
+HOST_MAX_WORKERS = {
+    "www.moef.go.kr": 4,
+    "www.nts.go.kr": 4,
+    "www.customs.go.kr": 4,
+    "www.pps.go.kr": 6,
+    "sri.kostat.go.kr": 4,
+}
+
+# 호스트별로 유지할 keep-alive 연결 수. 지정하지 않은 호스트는 동시 요청 수와 같게 잡습니다.
+# 환경변수 CRAWLER_POOL_MAXSIZE 로 모든 호스트의 값을 한 번에 바꿀 수 있습니다.
+HOST_POOL_MAXSIZE = {}
+
+# 모든 요청의 scheme://host[:port] 를 이 주소로 바꿔 보냅니다. (경로와 쿼리는 그대로)
+# 벤치마크용 대역 서버(benchmarks/stub_server.py)를 가리킬 때 사용하며, 환경변수 CRAWLER_BASE_URL 로도 지정할 수 있습니다.
+BASE_URL_OVERRIDE = os.environ.get("CRAWLER_BASE_URL") or None
+
+_session = None
+_mounted = set()
+_lock = threading.Lock()
+
+
+def get_max_workers(url, max_workers=None):
+    """
+    크롤링에 사용할 동시 요청 수를 반환합니다.
+    max_workers 가 주어지면 그 값을, 아니면 url 의 호스트에 설정된 값을 사용합니다.
+    """
+    if max_workers is not None:
+        return max(1, int(max_workers))
+    host = urlparse(url).hostname or ""
+    return HOST_MAX_WORKERS.get(host, DEFAULT_MAX_WORKERS)
+
+
+def set_base_url_override(base_url):
+    """
+    요청을 보낼 기준 주소를 바꿉니다. (예: "http://127.0.0.1:8765")
+    None 을 넘기면 원래 기관 주소로 요청합니다.
+    """
+    global BASE_URL_OVERRIDE
+    BASE_URL_OVERRIDE = base_url.rstrip("/") if base_url else None
+
+
+def resolve_url(url):
+    """BASE_URL_OVERRIDE 가 설정되어 있으면 url 의 scheme 과 호스트를 그 주소로 바꿔 반환합니다."""
+    if not BASE_URL_OVERRIDE:
+        return url
+    parsed = urlparse(url)
+    target = urlparse(BASE_URL_OVERRIDE)
+    return parsed._replace(scheme=target.scheme, netloc=target.netloc).geturl()
+
+
+def _pool_maxsize(url):
+    if os.environ.get("CRAWLER_POOL_MAXSIZE"):
+        return int(os.environ["CRAWLER_POOL_MAXSIZE"])
+    if BASE_URL_OVERRIDE:
+        # 대역 서버 하나가 모든 기관의 요청을 받으므로 기관별 연결 수를 합한 만큼 유지합니다.
+        return sum(HOST_MAX_WORKERS.values())
+    host = urlparse(url).hostname or ""
+    return HOST_POOL_MAXSIZE.get(host, get_max_workers(url))
+
+
+def get_session(url):
+    """
+    모든 크롤러가 함께 쓰는 requests.Session 을 반환합니다.
+    url 의 호스트에 처음 요청할 때 그 호스트 전용 연결 풀(HTTPAdapter)을 마운트합니다.
+    """
+    global _session
+    parsed = urlparse(url)
+    prefix = f"{parsed.scheme}://{parsed.netloc}"
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update(DEFAULT_HEADERS)
+        if prefix not in _mounted:
+            size = _pool_maxsize(url)
+            _session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=size))
+            _mounted.add(prefix)
+        return _session
+
+
+def get(url, **kwargs):
+    """공유 세션으로 GET 요청을 보냅니다. 인자는 requests.get 과 같습니다."""
+    url = resolve_url(url)
+    return get_session(url).get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    """공유 세션으로 POST 요청을 보냅니다. 인자는 requests.post 와 같습니다."""
+    url = resolve_url(url)
+    return get_session(url).post(url, **kwargs)
+
+
+def connection_stats():
+    """
+    호스트별 연결 재사용 통계를 반환합니다.
+    {host: {"requests": 요청 수, "connections": 새로 연 연결 수, "reused": 재사용된 요청 수}}
+    reused 가 requests 에 가까울수록 TCP/TLS 핸드셰이크가 반복되지 않았다는 뜻입니다.
+    """
+    stats = {}
+    with _lock:
+        if _session is None:
+            return stats
+        adapters = [_session.adapters[prefix] for prefix in _mounted]
+    for adapter in adapters:
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            entry = stats.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+            entry["requests"] += pool.num_requests
+            entry["connections"] += pool.num_connections
+            entry["reused"] += max(0, pool.num_requests - pool.num_connections)
+    return stats
+
+
+def reset_session():
+    """공유 세션을 닫고 통계를 초기화합니다. 다음 요청 때 새 세션이 만들어집니다."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _mounted.clear()
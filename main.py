@@ -1,83 +1,164 @@
 import streamlit as st
 import pandas as pd
-from crawler_kijaebu import scrape_moef_data
-from crawler_gooksechung import scrape_nts_data
-from crawler_customs import scrape_customs_data
-from crawler_pps import scrape_pps_data
-from crawler_kostat import scrape_kostat_data
-import threading
-import schedule
+from agencies import AGENCY_NAMES
+import store
+import metrics
+import table_snapshot
+from search_index import TitleIndex, DateIndex, MODE_AND, MODE_OR
 import time
+import uuid
 import datetime
 
+# 크롤링 워커(worker.py)가 갱신 중일 때 화면을 다시 그리는 주기(초)
+REFRESH_INTERVAL = 2
+
+# 모든 기관의 공지사항을 등록일 순으로 합쳐 보여 주는 메뉴
+ALL_KEY = "all"
+ALL_LABEL = "전체"
+
+# 검색 방식 선택지: {표시 이름: search_index 결합 방식}
+SEARCH_MODES = {"모두 포함": MODE_AND, "하나라도 포함": MODE_OR}
+
+# 한 페이지에 표시할 공지사항 수 선택지 (첫 번째 값이 기본값)
+PAGE_SIZES = (20, 50, 100)
+
+# 방문자를 구분하는 주소의 쿼리 파라미터. 변경을 처음 확인할 때 만들어 주소에 넣으며,
+# 그 주소로 다시 열면(새로 고침, 즐겨찾기) 같은 방문자로 봅니다.
+VISITOR_PARAM = "visitor"
+
+# 확인 기록이 없는 방문자(주소에 VISITOR_PARAM 이 없거나 기록이 지워진 방문자)에게 보여 줄 최근 변경 기간(초)
+FIRST_VISIT_WINDOW = 24 * 3600
+
+# 변경 기록의 종류별 표시 이름
+CHANGE_LABELS = {store.CHANGE_NEW: "새 글", store.CHANGE_REMOVED: "삭제", store.CHANGE_TITLE: "제목 변경"}
+
+# 워커가 이 시간(초) 넘게 진행 상황을 갱신하지 않으면 멈춘 것으로 보고 "진행 중"으로 표시하지 않습니다.
+STALE_AFTER = 300
+
 
 def main():
     st.title("공공기관 공지사항 모음")
 
-    data_tasks = [
-        ("moef", load_moef_data),
-        ("nts", load_nts_data),
-        ("customs", load_customs_data),
-        ("pps", load_pps_data),
-        ("kostat", load_kostat_data)
-    ]
-
-    results = {}
-    with st.spinner("데이터 가져오는 중... 시간이 좀 소요될 수 있습니다"):
-        for key, task in data_tasks:
-            results[key] = task()
+    # 화면은 저장소만 읽습니다. 크롤링은 별도 프로세스의 worker.py 가 담당하며,
+    # 워커가 페이지마다 저장하는 게시글을 크롤링이 끝나기 전에도 바로 보여 줍니다.
+    crawl_status = store.load_crawl_status()
 
-    moef_data = results["moef"]
-    nts_data = results["nts"]
-    customs_data = results["customs"]
-    pps_data = results["pps"]
-    kostat_data = results["kostat"]
+    visitor = current_visitor()
 
     # 좌측 사이드바 메뉴로 데이터 선택
     st.sidebar.title("기관 선택")
-    option = st.sidebar.radio("공지사항 데이터", ("기획재정부", "국세청", "관세청", "조달청", "통계청"))
-
-    if option == "기획재정부":
-        st.header("기획재정부")
-        data = moef_data
-    elif option == "국세청":
-        st.header("국세청")
-        data = nts_data
-    elif option == "관세청":
-        st.header("관세청")
-        data = customs_data
-    elif option == "조달청":
-        st.header("조달청")
-        data = pps_data
+    option = st.sidebar.radio("공지사항 데이터", (*AGENCY_NAMES.values(), ALL_LABEL))
+    if option == ALL_LABEL:
+        selected_key = ALL_KEY
+        st.header("전체 기관 최신 공지사항")
     else:
-        st.header("통계청")
-        data = kostat_data
+        selected_key = next(key for key, name in AGENCY_NAMES.items() if name == option)
+        st.header(option)
+    new_only = st.sidebar.checkbox("확인하지 않은 새 글만 보기")
 
-    if not data:
-        st.write("공지사항 데이터가 없습니다.")
-        return
-
-    # 표 상단에 검색창을 오른쪽에 배치
+    # 표 상단 왼쪽에 등록일 기간, 오른쪽에 검색창을 배치
     col1, col2 = st.columns([3, 1])
     with col1:
-        st.write("")  # 왼쪽 공간 비워둠
+        date_range = st.date_input("등록일 기간", value=(), format="YYYY-MM-DD")
     with col2:
-        search_keyword = st.text_input("공지사항 제목 검색", "")
+        search_keyword = st.text_input("공지사항 제목 검색", "", help="여러 단어는 공백으로 구분합니다.")
+        search_mode = SEARCH_MODES[st.radio("검색 방식", tuple(SEARCH_MODES), horizontal=True)]
+
+    # 워커가 크롤링 중이면 REFRESH_INTERVAL 마다 표와 진행 상황만 다시 그립니다.
+    run_every = REFRESH_INTERVAL if running_agencies(crawl_status) else None
+    st.fragment(render_agency_view, run_every=run_every)(
+        selected_key, search_keyword, search_mode, date_range, new_only, visitor
+    )
+
+    if st.sidebar.checkbox("크롤링 진단 정보 보기"):
+        show_diagnostics()
 
-    # DataFrame 생성 후 제목 검색어가 있다면 필터링
-    df = pd.DataFrame(data)
+
+def render_agency_view(agency, search_keyword, search_mode=MODE_AND, date_range=(), new_only=False, visitor=None):
+    """
+    기관별 크롤링 진행 상황과 선택한 기관(ALL_KEY 이면 전체 기관)의 공지사항 표를 그립니다.
+    크롤링 중에는 주기적으로 다시 실행되어 새로 저장된 게시글을 이어서 보여 줍니다.
+    date_range 는 st.date_input 의 값((), (시작일,) 또는 (시작일, 종료일))입니다.
+    visitor(current_visitor)가 변경 기록을 마지막으로 확인한 뒤의 변경을 보여 주며(확인 기록이 없으면 최근
+    FIRST_VISIT_WINDOW 동안의 변경),
+    new_only 이면 그중 새 글로 기록된 게시글만 표에 보여 줍니다.
+    """
+    crawl_status = store.load_crawl_status()
+    running = bool(running_agencies(crawl_status))
+    if running:
+        show_crawl_progress(crawl_status)
+    elif st.session_state.get("crawl_was_running"):
+        # 크롤링이 모두 끝났으면 전체 화면을 한 번 다시 그려 주기적 갱신을 멈춥니다.
+        st.session_state["crawl_was_running"] = False
+        st.rerun()
+    st.session_state["crawl_was_running"] = running
+
+    if agency == ALL_KEY:
+        version = store.data_version()
+        status = feed_status(crawl_status)
+        refreshing = running
+    else:
+        version = store.data_version(agency)
+        status = crawl_status.get(agency)
+        refreshing = agency in running_agencies(crawl_status)
+
+    if not version[0]:
+        if refreshing:
+            st.write("첫 페이지를 불러오는 중입니다...")
+        elif status and status["state"] == "error":
+            st.write("데이터를 불러오지 못했습니다. 잠시 후 다시 시도해주세요.")
+        elif status is None:
+            st.write("아직 수집된 공지사항이 없습니다. 크롤링 워커(python worker.py)가 실행 중인지 확인해주세요.")
+        else:
+            st.write("공지사항 데이터가 없습니다.")
+        return
+
+    show_data_age(status, refreshing)
+    seen_at = load_seen_at(visitor)
+    if seen_at is None:
+        seen_at = time.time() - FIRST_VISIT_WINDOW
+    all_changes = store.load_changes(seen_at)
+    changes = all_changes if agency == ALL_KEY else [c for c in all_changes if c["agency"] == agency]
+    show_changes(changes, visitor, all_changes)
+
+    # 저장된 데이터가 바뀌었을 때만 DataFrame 과 검색 색인을 다시 만듭니다.
+    # 검색어는 제목 색인으로, 등록일 기간은 날짜 색인의 이진 탐색으로 필터링합니다.
+    df, index, dates = load_agency_table(agency, version)
+    # 기간의 시작일만 고른 상태이면 그날 하루만 봅니다.
+    start, end = (date_range[0], date_range[-1]) if date_range else (None, None)
     if search_keyword:
-        df = df[df["제목"].str.contains(search_keyword, case=False)]
+        rows = index.search(search_keyword, mode=search_mode)
+        if date_range:
+            rows = dates.filter(rows, start, end)
+        df = df.iloc[rows]
+    elif date_range:
+        lo, hi = dates.range(start, end)
+        df = df.iloc[lo:hi]
+    if new_only:
+        df = df[new_post_mask(df, agency, changes)]
 
     st.write("총 공지사항 수:", len(df))
 
-    # 제목을 하이퍼링크로 변환 (클릭 시 새 탭에서 상세페이지 열림)
-    df["제목"] = df.apply(
-        lambda row: f'<a href="{row["링크"]}" target="_blank">{row["제목"]}</a>',
-        axis=1
-    )
-    # 표에서 "링크" 컬럼은 제거
-    df.drop(columns=["링크"], inplace=True)
+    # 현재 페이지에 해당하는 행만 잘라 HTML 로 만듭니다. 전체 행 수와 관계없이 브라우저로 보내는 양이 일정합니다.
+    # 검색 조건이 바뀌면 첫 페이지로 돌아갑니다.
+    page_key = f"{agency}_page"
+    filter_key = f"{agency}_filter"
+    current_filter = (search_keyword, search_mode, tuple(date_range), new_only)
+    if st.session_state.get(filter_key, current_filter) != current_filter:
+        st.session_state[page_key] = 1
+    st.session_state[filter_key] = current_filter
+
+    items_per_page = st.session_state.get("items_per_page", PAGE_SIZES[0])
+    total_pages = max(1, (len(df) - 1) // items_per_page + 1)
+    current_page = get_current_page(page_key, total_pages)
+    start_idx = (current_page - 1) * items_per_page
+    df_page = df.iloc[start_idx:start_idx + items_per_page]
+
+    # 제목을 하이퍼링크로 변환 (클릭 시 새 탭에서 상세페이지 열림). 행별 apply 대신 열 단위 문자열 연산을 씁니다.
+    # (캐시된 DataFrame 을 바꾸지 않도록 assign/drop 으로 새 DataFrame 을 만듭니다.)
+    df_page = df_page.assign(제목='<a href="' + df_page["링크"] + '" target="_blank">' + df_page["제목"] + '</a>')
+    # 표에서 "링크", "게시글ID" 컬럼은 제거 (전체 보기에서 부서명이 없는 기관은 빈 칸)
+    df_page = df_page.drop(columns=["링크", "게시글ID"], errors="ignore").fillna("")
 
     # CSS 스타일 추가: 전체 테이블 스타일 및 두 번째 열(등록일)의 최소 너비 지정
     style = """
@@ -93,58 +174,298 @@ def main():
     """
     st.markdown(style, unsafe_allow_html=True)
 
-    # 전체 테이블을 스크롤 가능한 영역에 표시 (최대 높이 600px)
-    table_html = df.to_html(escape=False, index=False)
+    # 현재 페이지 표를 스크롤 가능한 영역에 표시 (최대 높이 600px)
+    table_html = df_page.to_html(escape=False, index=False)
     st.markdown(f'<div style="max-height:600px; overflow-y:auto;">{table_html}</div>', unsafe_allow_html=True)
+    pagination_ui(current_page, total_pages, page_key)
 
 
-@st.cache_data(show_spinner=False)
-def load_moef_data():
-    return scrape_moef_data()
+def get_current_page(key, total_pages):
+    """
+    세션에 저장된 key 의 현재 페이지 번호를 반환합니다.
+    세션에 없으면 URL 쿼리 파라미터(?key=N)에서 읽고, 값이 없거나 잘못되었으면 1을 사용합니다.
+    데이터나 검색 결과가 줄어 범위를 벗어나면 마지막 페이지로 맞춥니다.
+    """
+    if key not in st.session_state:
+        try:
+            st.session_state[key] = int(st.query_params.get(key, 1))
+        except ValueError:
+            st.session_state[key] = 1
+    page = min(max(1, st.session_state[key]), total_pages)
+    st.session_state[key] = page
+    return page
 
 
-@st.cache_data(show_spinner=False)
-def load_nts_data():
-    return scrape_nts_data()
+def _move_page(key, page):
+    st.session_state[key] = page
 
 
-@st.cache_data(show_spinner=False)
-def load_customs_data():
-    return scrape_customs_data()
+def pagination_ui(current_page, total_pages, key):
+    """
+    표 아래에 페이지 이동 버튼(처음/이전/다음/끝)과 페이지 번호 입력, 페이지당 표시 수 선택을 그립니다.
+    위젯으로 이동하므로 전체 화면이 아니라 표 영역만 다시 그려지며, 현재 페이지는 URL 쿼리 파라미터에도 남깁니다.
+    """
+    cols = st.columns([1, 1, 2, 1, 1, 2])
+    cols[0].button("<<", key=f"{key}_first", on_click=_move_page, args=(key, 1), disabled=current_page <= 1)
+    cols[1].button("<", key=f"{key}_prev", on_click=_move_page, args=(key, current_page - 1), disabled=current_page <= 1)
+    cols[2].number_input(
+        "페이지", min_value=1, max_value=total_pages, step=1, key=key, label_visibility="collapsed"
+    )
+    cols[3].button(
+        ">", key=f"{key}_next", on_click=_move_page, args=(key, current_page + 1), disabled=current_page >= total_pages
+    )
+    cols[4].button(
+        ">>", key=f"{key}_last", on_click=_move_page, args=(key, total_pages), disabled=current_page >= total_pages
+    )
+    cols[5].selectbox("페이지당 표시 수", PAGE_SIZES, key="items_per_page", label_visibility="collapsed")
+    st.caption(f"{current_page} / {total_pages} 페이지")
+    st.query_params[key] = str(current_page)
 
 
-@st.cache_data(show_spinner=False)
-def load_pps_data():
-    return scrape_pps_data()
+@st.cache_resource(max_entries=2 * (len(AGENCY_NAMES) + 1))
+def load_agency_table(agency, version):
+    """
+    기관(ALL_KEY 이면 전체 기관)의 게시글을 등록일 내림차순 DataFrame 과
+    제목 검색 색인(TitleIndex), 등록일 색인(DateIndex)으로 만들어 반환합니다.
+    version(store.data_version)이 같으면 다시 만들지 않고 캐시된 객체를 그대로 돌려주므로 바꾸지 말고 읽기만 합니다.
+    """
+    # 워커가 저장해 둔 같은 버전의 표 파일이 있으면 메모리 매핑해 그대로 쓰고, 없으면 저장소에서 열 단위로 읽습니다.
+    # 기관명은 등록일 바로 뒤 열입니다. (표 스타일 참고)
+    key = None if agency == ALL_KEY else agency
+    df = table_snapshot.load_snapshot(key, version)
+    if df is None:
+        df = store.load_batch(key).to_frame()
+    if agency == ALL_KEY:
+        df["기관"] = df["기관"].map(AGENCY_NAMES)
+    return df, TitleIndex(df["제목"]), DateIndex(df["등록일"])
 
 
-@st.cache_data(show_spinner=False)
-def load_kostat_data():
-    return scrape_kostat_data()
+def new_post_mask(df, agency, changes):
+    """
+    df 에서 changes(store.load_changes) 에 새 글로 기록된 게시글 행을 고르는 불리언 Series 를 반환합니다.
+    표를 다시 비교하지 않고 기관별 게시글ID 집합으로 찾습니다. (전체 보기의 기관 열은 표시 이름입니다.)
+    """
+    new_ids = {}
+    for change in changes:
+        if change["kind"] == store.CHANGE_NEW:
+            new_ids.setdefault(change["agency"], set()).add(change["post_id"])
+    if agency != ALL_KEY:
+        return df["게시글ID"].isin(new_ids.get(agency, set()))
+    mask = pd.Series(False, index=df.index)
+    for key, ids in new_ids.items():
+        mask |= (df["기관"] == AGENCY_NAMES.get(key, key)) & df["게시글ID"].isin(ids)
+    return mask
 
 
-def update_data_job():
+def current_visitor():
     """
-    매일 오후 6시(KST)에 실행되어 캐시 데이터를 초기화하여
-    새로운 크롤링 데이터를 가져오도록 합니다.
+    주소의 VISITOR_PARAM 쿼리 파라미터에서 방문자 ID 를 반환합니다. 아직 변경을 확인한 적이 없어 ID 가 없으면 None 입니다.
+    방문자는 주소로만 구분하므로 ID 가 없는 주소로 열면 확인 기록이 이어지지 않고, 주소를 공유하면 확인 기록도 함께 씁니다.
+    (show_changes 에서 이 점을 안내합니다.)
     """
-    load_moef_data.clear()
-    load_nts_data.clear()
-    load_customs_data.clear()
-    load_pps_data.clear()
-    load_kostat_data.clear()
-    print("공지사항 업데이트 작업 실행:", datetime.datetime.now())
+    return st.query_params.get(VISITOR_PARAM) or None
 
 
-def run_schedule():
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+def load_seen_at(visitor):
+    """
+    방문자의 변경 확인 시각을 반환합니다. 저장소는 세션마다 한 번만 읽고 session_state 에 둡니다.
+    (크롤링 중에는 표가 REFRESH_INTERVAL 마다 다시 그려지므로 그때마다 읽지 않도록)
+    방문자 ID 가 없거나 확인 기록이 없으면 None 을 반환합니다.
+    """
+    if not visitor:
+        return None
+    key = f"seen_at:{visitor}"
+    if key not in st.session_state:
+        st.session_state[key] = store.load_seen_at(visitor)
+    return st.session_state[key]
+
+
+def acknowledge_changes(visitor, seen_at):
+    """
+    "모두 확인" 버튼의 콜백입니다. seen_at 까지의 변경을 확인했다고 저장소와 session_state 에 기록합니다.
+    방문자 ID 가 없으면 새로 만들어 주소(VISITOR_PARAM)에 넣습니다.
+    """
+    if not visitor:
+        visitor = uuid.uuid4().hex
+        st.query_params[VISITOR_PARAM] = visitor
+    store.save_seen_at(visitor, seen_at)
+    st.session_state[f"seen_at:{visitor}"] = seen_at
+
+
+def show_changes(changes, visitor=None, all_changes=None):
+    """
+    방문자가 마지막으로 확인한 뒤의 변경(changes) 건수를 보여 주고, 펼치면 변경 기록을 최신순으로 보여 줍니다.
+    확인 시각은 방문자가 "모두 확인" 을 눌렀을 때만 전체 기관의 변경(all_changes) 중 가장 최근 것까지 옮기므로,
+    새로 고침해도 확인하지 않은 변경은 사라지지 않습니다. 확인 기록이 주소에 묶여 있다는 점도 함께 안내합니다.
+    """
+    if visitor:
+        note = "확인 기록은 이 주소에 저장됩니다. 주소를 즐겨찾기하면 다음 방문에도 이어지고, 공유하면 함께 쓰게 됩니다."
+    else:
+        note = (
+            f"확인 기록이 없어 최근 {FIRST_VISIT_WINDOW // 3600}시간의 변경을 보여 줍니다. "
+            "모두 확인을 누르면 확인 기록이 주소에 저장됩니다."
+        )
+    if not changes:
+        st.caption(f"확인하지 않은 공지사항 변경이 없습니다. {note}")
+        return
+    counts = {kind: 0 for kind in CHANGE_LABELS}
+    for change in changes:
+        counts[change["kind"]] += 1
+    summary = " · ".join(f"{label} {counts[kind]}건" for kind, label in CHANGE_LABELS.items())
+    with st.expander(f"확인하지 않은 변경: {summary}"):
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "시각": [datetime.datetime.fromtimestamp(c["detected_at"]) for c in changes],
+                    "기관": [AGENCY_NAMES.get(c["agency"], c["agency"]) for c in changes],
+                    "종류": [CHANGE_LABELS[c["kind"]] for c in changes],
+                    "제목": [c["title"] for c in changes],
+                    "이전 제목": [c["old_title"] or "" for c in changes],
+                }
+            ),
+            hide_index=True,
+        )
+        latest = (all_changes or changes)[0]["detected_at"]
+        st.button("전체 기관 변경 모두 확인", on_click=acknowledge_changes, args=(visitor, latest))
+        st.caption(note)
+
+
+def feed_status(crawl_status):
+    """
+    전체 보기의 데이터 기준 시각으로 쓸 crawl_status 를 반환합니다.
+    가장 오래전에 갱신된 기관의 기록이며, 아직 한 번도 갱신되지 않은 기관이 있으면 None 입니다.
+    """
+    statuses = [crawl_status.get(key) for key in AGENCY_NAMES]
+    if any(status is None or not status["snapshot_at"] for status in statuses):
+        return None
+    return min(statuses, key=lambda status: status["snapshot_at"])
+
+
+def running_agencies(crawl_status):
+    """워커가 지금 크롤링 중인 기관 키 목록을 반환합니다. 오래 갱신되지 않은 기록은 제외합니다."""
+    now = time.time()
+    return [
+        key for key, status in crawl_status.items()
+        if status["state"] == "running" and now - (status["updated_at"] or 0) < STALE_AFTER
+    ]
+
+
+def format_age(seconds):
+    """경과 시간(초)을 "3분 전" 같은 문자열로 바꿉니다."""
+    if seconds < 60:
+        return "방금 전"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}분 전"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}시간 전"
+    return f"{int(seconds // 86400)}일 전"
+
+
+def show_data_age(status, refreshing):
+    """표시 중인 데이터가 언제 수집된 것인지(데이터 기준 시각)와 갱신 중 여부를 보여 줍니다."""
+    if not status or not status["snapshot_at"]:
+        st.caption("데이터 기준 시각: 수집 중")
+        return
+    snapshot_time = datetime.datetime.fromtimestamp(status["snapshot_at"])
+    caption = (
+        f"데이터 기준 시각: {snapshot_time:%Y-%m-%d %H:%M} "
+        f"({format_age(time.time() - status['snapshot_at'])})"
+    )
+    if refreshing:
+        caption += " · 새 데이터를 가져오는 중이며, 끝나면 한 번에 바뀝니다"
+    st.caption(caption)
+
+
+def _metric(section, label, name, field=None):
+    """metrics 스냅샷에서 label 의 지표 값을 꺼냅니다. 없으면 0 (히스토그램 필드가 None 이면 0)"""
+    value = section.get(label, {}).get(name, 0)
+    if field is not None:
+        value = (value or {}).get(field) or 0
+    return value
+
+
+def show_diagnostics():
+    """
+    크롤링 워커가 기록한 지표(metrics.METRICS_PATH)를 기관별 단계(요청/파싱)와 호스트별 네트워크 표로 보여 줍니다.
+    어느 기관의 어느 단계가 갱신 시간을 많이 쓰는지 찾는 데 사용합니다.
+    """
+    st.subheader("크롤링 진단 정보")
+    snapshot = metrics.load()
+    if not snapshot:
+        st.write("아직 기록된 크롤링 지표가 없습니다. 크롤링 워커가 한 기관 이상 갱신을 마치면 표시됩니다.")
+        return
+    started = datetime.datetime.fromtimestamp(snapshot["started_at"])
+    updated = datetime.datetime.fromtimestamp(snapshot["updated_at"])
+    st.caption(f"집계 기간: {started:%Y-%m-%d %H:%M} ~ {updated:%Y-%m-%d %H:%M} (워커 시작 이후 누적)")
+
+    counters, histograms = snapshot["counters"], snapshot["histograms"]
+    stages = pd.DataFrame([
+        {
+            "기관": name,
+            "페이지": _metric(counters, name, "pages"),
+            "실패 페이지": _metric(counters, name, "failed_pages"),
+            "변경 없는 페이지": _metric(counters, name, "unchanged_pages"),
+            "게시글": _metric(counters, name, "rows"),
+            "페이지당 게시글": round(_metric(histograms, name, "rows_per_page", "mean"), 1),
+            "요청 평균(초)": round(_metric(histograms, name, "page_fetch_seconds", "mean"), 3),
+            "요청 p95(초)": round(_metric(histograms, name, "page_fetch_seconds", "p95"), 3),
+            "요청 합계(초)": round(_metric(histograms, name, "page_fetch_seconds", "sum"), 1),
+            "파싱 평균(ms)": round(_metric(histograms, name, "parse_seconds", "mean") * 1000, 1),
+            "파싱 합계(초)": round(_metric(histograms, name, "parse_seconds", "sum"), 1),
+        }
+        for name in AGENCY_NAMES.values()
+    ]).set_index("기관")
+    st.write("기관별 단계 (요청 시간은 재시도와 대기 포함, 변경 없는 페이지는 파싱하지 않음)")
+    st.dataframe(stages)
+    st.bar_chart(stages[["요청 합계(초)", "파싱 합계(초)"]])
+
+    hosts = [label for label in counters if label not in AGENCY_NAMES.values()]
+    network = pd.DataFrame([
+        {
+            "호스트": host,
+            "요청": _metric(counters, host, "requests"),
+            "304 응답": _metric(counters, host, "not_modified"),
+            "재시도": _metric(counters, host, "retries"),
+            "오류": _metric(counters, host, "request_errors"),
+            "차단으로 거절": _metric(counters, host, "circuit_rejected"),
+            "속도 제한 대기(초)": round(_metric(counters, host, "rate_limit_wait_seconds"), 1),
+            "다운로드(MB)": round(_metric(counters, host, "bytes") / 1_000_000, 2),
+            "응답 평균(초)": round(_metric(histograms, host, "request_seconds", "mean"), 3),
+            "응답 p95(초)": round(_metric(histograms, host, "request_seconds", "p95"), 3),
+        }
+        for host in sorted(hosts)
+    ])
+    if not network.empty:
+        st.write("호스트별 네트워크")
+        st.dataframe(network.set_index("호스트"))
+
+
+def show_crawl_progress(crawl_status):
+    """워커의 기관별 크롤링 진행 상황을 진행 막대로 보여 줍니다."""
+    running = running_agencies(crawl_status)
+    if any(not crawl_status[key]["snapshot_at"] for key in running):
+        label = "데이터 가져오는 중... 먼저 수집된 공지사항부터 표시합니다"
+    else:
+        label = "데이터 갱신 중... 갱신이 끝날 때까지 이전 데이터를 표시합니다"
+    with st.expander(label, expanded=True):
+        for key, name in AGENCY_NAMES.items():
+            status = crawl_status.get(key)
+            if status is None:
+                continue
+            if key in running:
+                # 마지막 페이지는 크롤러가 첫 페이지를 받은 뒤에 알 수 있습니다.
+                total_pages = status["total_pages"]
+                ratio = min(status["pages"] / total_pages, 1.0) if total_pages else 0.0
+                pages = f"{status['pages']}/{total_pages}" if total_pages else f"{status['pages']}"
+                text = f"{name}: {pages}페이지, {status['rows']}건 수집 중"
+                if status["snapshot_at"]:
+                    text += " (완료 후 반영)"
+            elif status["state"] == "error":
+                ratio, text = 1.0, f"{name}: 불러오기 실패 ({status['error']})"
+            else:
+                ratio, text = 1.0, f"{name}: 완료 ({status['rows']}건)"
+            st.progress(ratio, text=text)
 
 
 if __name__ == "__main__":
-    # 매일 한국시간 오후 6시에 데이터 업데이트 작업 예약
-    schedule.every().day.at("18:00").do(update_data_job)
-    # 별도 스레드에서 스케줄러 실행
-    threading.Thread(target=run_schedule, daemon=True).start()
     main()
@@ -1,13 +1,11 @@
 import streamlit as st
-import pandas as pd
 from stqdm import stqdm
-from crawler_kijaebu import scrape_moef_data
-from crawler_gooksechung import scrape_nts_data
-from crawler_customs import scrape_customs_data
-import threading
-import schedule
-import time
-import datetime
+from agencies import SCRAPE_FUNCS
+from records import RecordBatch
+
+# 크롤링 결과를 캐시에 두는 시간. 지나면 다음 접속 때 다시 크롤링합니다.
+# (예전에는 schedule 로 매일 오후 6시에 캐시를 지웠습니다. 주기적인 갱신은 이제 worker.py 가 맡습니다.)
+CACHE_TTL = "1d"
 
 
 def main():
@@ -43,7 +41,7 @@ def main():
         data = customs_data
         page_key = "customs_page"  # 관세청 탭에 사용할 쿼리 파라미터 키
 
-    if not data:
+    if data.empty:
         st.write("공지사항 데이터가 없습니다.")
         return
 
@@ -54,8 +52,8 @@ def main():
     with col2:
         search_keyword = st.text_input("제목 검색", "")
 
-    # DataFrame 생성 후 제목 검색어가 있다면 필터링
-    df = pd.DataFrame(data)
+    # 제목 검색어가 있다면 필터링
+    df = data
     if search_keyword:
         df = df[df["제목"].str.contains(search_keyword, case=False)]
 
@@ -66,8 +64,8 @@ def main():
         lambda row: f'<a href="{row["링크"]}" target="_blank">{row["제목"]}</a>',
         axis=1
     )
-    # 표에서 "링크" 컬럼은 제거
-    df.drop(columns=["링크"], inplace=True)
+    # 표에서 "링크", "게시글ID" 컬럼은 제거
+    df = df.drop(columns=["링크", "게시글ID"])
 
     # 페이지네이션 설정 (한 페이지에 10개씩)
     current_page = get_current_page(page_key)
@@ -82,19 +80,19 @@ def main():
     pagination_ui(current_page, total_pages, page_key)
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
 def load_moef_data():
-    return scrape_moef_data()
+    return RecordBatch.from_records(SCRAPE_FUNCS["moef"]()).to_frame()
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
 def load_nts_data():
-    return scrape_nts_data()
+    return RecordBatch.from_records(SCRAPE_FUNCS["nts"]()).to_frame()
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL)
 def load_customs_data():
-    return scrape_customs_data()
+    return RecordBatch.from_records(SCRAPE_FUNCS["customs"]()).to_frame()
 
 
 def get_current_page(key="page"):
@@ -166,26 +164,6 @@ def pagination_ui(current_page, total_pages, key="page", max_pages_to_show=5):
     pagination_html += f'<div class="pagination-container"><div class="pagination">{"".join(page_links)}</div></div>'
     st.markdown(pagination_html, unsafe_allow_html=True)
 
-def update_data_job():
-    """
-    매일 오후 6시(KST)에 실행되어 캐시 데이터를 초기화하여
-    새로운 크롤링 데이터를 가져오도록 합니다.
-    """
-    load_moef_data.clear()
-    load_nts_data.clear()
-    load_customs_data.clear()
-    print("데이터 업데이트 작업 실행:", datetime.datetime.now())
-
-
-def run_schedule():
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
-
 
 if __name__ == "__main__":
-    # 매일 한국시간 오후 6시에 데이터 업데이트 작업 예약
-    schedule.every().day.at("18:00").do(update_data_job)
-    # 별도 스레드에서 스케줄러 실행
-    threading.Thread(target=run_schedule, daemon=True).start()
     main()
@@ -0,0 +1,169 @@
+"""
+크롤링 지표(카운터와 히스토그램)를 모으는 모듈입니다.
+
+- 네트워크 단계(resilience.request): 호스트별 요청 수, 요청 시간, 내려받은 바이트, 재시도, 오류, 차단 횟수, 304 응답 수
+- 페이지 단계(crawler_common.iter_pages): 기관별 페이지 요청 시간(재시도 포함), 파싱 시간, 페이지당 게시글 수,
+  지난 크롤링과 같아 파싱을 건너뛴 페이지 수
+
+지표는 프로세스 메모리에 쌓이므로 크롤링 워커는 dump() 로 JSON 파일(METRICS_PATH)에 기록하고,
+화면(main.py)은 load() 로 그 파일을 읽습니다. serve(port) 로 GET /metrics JSON 엔드포인트를 띄울 수도 있습니다.
+"""
+import os
+import json
+import time
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 지표 JSON 파일 경로 (환경변수 CRAWLER_METRICS_PATH 로 변경 가능)
+METRICS_PATH = os.environ.get(
+    "CRAWLER_METRICS_PATH", os.path.join(os.environ.get("CRAWLER_DATA_DIR", "data"), "metrics.json")
+)
+
+# 히스토그램 구간 상한. 마지막 값보다 큰 관측치는 +Inf 구간에 들어갑니다.
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BYTES_BUCKETS = (1_000, 10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000)
+ROWS_BUCKETS = (0, 1, 5, 10, 15, 20, 30, 50, 100)
+
+HISTOGRAM_BUCKETS = {
+    "request_seconds": SECONDS_BUCKETS,
+    "page_fetch_seconds": SECONDS_BUCKETS,
+    "parse_seconds": SECONDS_BUCKETS,
+    "response_bytes": BYTES_BUCKETS,
+    "rows_per_page": ROWS_BUCKETS,
+}
+
+
+class Histogram:
+    """구간별 개수와 합계/최소/최대를 기록하는 히스토그램. 분위수는 구간 상한으로 근사합니다."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """q 분위수(0~1)가 속한 구간의 상한을 반환합니다. 마지막 구간이면 최댓값을 반환합니다."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": {
+                **{str(bound): count for bound, count in zip(self.buckets, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+        }
+
+
+_counters = {}
+_histograms = {}
+_started_at = time.time()
+_lock = threading.Lock()
+
+
+def inc(name, label, value=1):
+    """label(기관 이름 또는 호스트)의 카운터 name 을 value 만큼 늘립니다."""
+    with _lock:
+        _counters[(name, label)] = _counters.get((name, label), 0) + value
+
+
+def observe(name, label, value):
+    """label 의 히스토그램 name 에 value 를 기록합니다. 구간은 HISTOGRAM_BUCKETS 를 따릅니다."""
+    with _lock:
+        histogram = _histograms.get((name, label))
+        if histogram is None:
+            histogram = _histograms[(name, label)] = Histogram(HISTOGRAM_BUCKETS.get(name, SECONDS_BUCKETS))
+        histogram.observe(value)
+
+
+def snapshot():
+    """
+    지금까지의 지표를 JSON 으로 바꿀 수 있는 딕셔너리로 반환합니다.
+    {"started_at", "updated_at", "counters": {label: {name: 값}}, "histograms": {label: {name: {...}}}}
+    """
+    with _lock:
+        counters = {}
+        for (name, label), value in _counters.items():
+            counters.setdefault(label, {})[name] = value
+        histograms = {}
+        for (name, label), histogram in _histograms.items():
+            histograms.setdefault(label, {})[name] = histogram.to_dict()
+    return {"started_at": _started_at, "updated_at": time.time(), "counters": counters, "histograms": histograms}
+
+
+def reset():
+    """모든 지표를 지웁니다."""
+    global _started_at
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _started_at = time.time()
+
+
+def dump(path=None):
+    """지표를 JSON 파일로 저장합니다. 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 바꿔치기합니다."""
+    path = path or METRICS_PATH
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load(path=None):
+    """dump() 로 저장한 지표를 읽어 반환합니다. 파일이 없으면 None 을 반환합니다."""
+    path = path or METRICS_PATH
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+        body = json.dumps(snapshot(), ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(port, host="127.0.0.1"):
+    """GET /metrics 로 현재 지표를 JSON 으로 돌려주는 HTTP 서버를 백그라운드 스레드에서 시작하고 서버를 반환합니다."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,56 @@
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def run_parallel(tasks, on_done=None, timeout=None, max_workers=None):
+    """
+    여러 기관의 데이터 로드 작업을 스레드 풀에서 동시에 실행합니다.
+
+    - tasks: (key, 함수) 튜플의 리스트. 각 함수는 인자 없이 호출됩니다.
+    - on_done(key, result, error, elapsed): 작업 하나가 끝날 때마다 호출 스레드에서 불립니다.
+      실패한 작업은 result 가 None 이고 error 에 예외가 들어갑니다.
+    - timeout: 전체 대기 시간(초). 시간 안에 끝나지 않은 작업은 기다리지 않고 pending 으로 돌려줍니다.
+      (스레드는 백그라운드에서 계속 실행되므로, 작업이 결과를 저장한다면 다음 호출 때 반영됩니다.)
+    - max_workers: 동시에 실행할 작업 수. 생략하면 모든 작업을 한꺼번에 실행합니다.
+
+    반환값: (results, errors, pending)
+      results: {key: 결과}, errors: {key: 예외}, pending: 끝나지 않은 key 리스트
+    """
+    results = {}
+    errors = {}
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers or len(tasks)))
+    futures = {}
+    for key, task in tasks:
+        futures[executor.submit(task)] = key
+
+    remaining = set(futures)
+    try:
+        while remaining:
+            wait_time = None
+            if timeout is not None:
+                wait_time = timeout - (time.perf_counter() - start)
+                if wait_time <= 0:
+                    break
+            done, remaining = wait(remaining, timeout=wait_time, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = futures[future]
+                elapsed = time.perf_counter() - start
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logging.error(f"{key} 데이터 로드 실패: {e}")
+                    errors[key] = e
+                    result = None
+                else:
+                    results[key] = result
+                    logging.info(f"{key} 데이터 로드 완료: {elapsed:.1f}초")
+                if on_done:
+                    on_done(key, result, errors.get(key), elapsed)
+    finally:
+        # 느린 작업 때문에 호출자가 막히지 않도록 종료를 기다리지 않습니다.
+        executor.shutdown(wait=False)
+
+    pending = [futures[future] for future in futures if future in remaining]
+    return results, errors, pending
@@ -0,0 +1,201 @@
+"""
+크롤러 실행 프로파일링 도구입니다.
+
+profiled(name) 블록 안의 실행을 cProfile 로 측정해 PROFILE_DIR/<name>.prof 로 저장하고
+(snakeviz, `python -m pstats` 등 표준 도구로 열 수 있습니다),
+기관(크롤러 모듈)별로 단계별 소요 시간을 계산해 출력하고 <name>.stages.json 으로 저장합니다.
+
+- 네트워크 대기: fetch_page (재시도, 속도 제한 대기 포함)
+- HTML 파싱: parse_page 에서 호출한 make_soup (BeautifulSoup 트리 생성)
+- 정규식 링크 생성: parse_page 에서 직접 호출한 정규식 함수 (re.search 등)
+- 행 추출: parse_page 의 나머지 (태그 탐색, 텍스트 추출, 게시글 객체 생성)
+
+실행 전체를 cProfile 하나로 측정합니다. (프로파일러를 겹쳐 켜면 파이썬 3.12 부터는
+"Another profiling tool is already active" 오류가 나므로 스레드마다 따로 켜지 않습니다.)
+cProfile 하나는 호출 스택도 하나라서, 파이썬 3.11 까지는 켠 스레드만 측정하고 3.12 부터는 모든 스레드를
+측정하지만 여러 스레드의 호출이 섞여 단계별 시간이 틀어집니다. 그래서 프로파일링 중에는 요청을 하나씩
+보내고(limit_workers) 기관도 하나씩 크롤링하며, 전체 시간은 평소(동시 요청) 크롤링보다 깁니다.
+파싱 프로세스 풀(crawler_common.PARSE_PROCESSES)의 자식 프로세스도 측정할 수 없으므로 프로파일링 중에는
+풀을 쓰지 않고 크롤링 스레드에서 파싱합니다.
+
+사용법 (저장소 최상위에서):
+    python crawler_pps.py --profile          # 조달청 크롤링 프로파일 → profiles/pps.prof
+    python profiling.py                      # 다섯 기관을 차례로 크롤링 → profiles/all.prof
+    python profiling.py --agency moef --agency nts --name moef_nts
+"""
+import os
+import re
+import sys
+import json
+import time
+import cProfile
+import pstats
+import logging
+import argparse
+from contextlib import contextmanager
+
+# 프로파일 결과를 저장할 디렉터리 (환경변수 CRAWLER_PROFILE_DIR 로 변경 가능)
+PROFILE_DIR = os.environ.get("CRAWLER_PROFILE_DIR", "profiles")
+
+STAGES = ("네트워크 대기", "HTML 파싱", "행 추출", "정규식 링크 생성")
+
+_enabled = False
+
+
+def enabled():
+    """profiled() 블록을 실행 중이면 True 를 반환합니다."""
+    return _enabled
+
+
+def limit_workers(max_workers):
+    """크롤링에 쓸 동시 요청 수를 반환합니다. 프로파일링 중이면 1 을, 아니면 max_workers 를 그대로 반환합니다."""
+    return 1 if _enabled else max_workers
+
+
+# 정규식 모듈(re)의 파일. 파이썬 3.11 부터는 re 패키지 디렉터리의 파일들, 그 전에는 re.py 와 sre_*.py 입니다.
+_RE_DIR = os.path.dirname(os.path.abspath(re.__file__))
+_RE_IS_PACKAGE = os.path.basename(re.__file__) == "__init__.py"
+_RE_FILES = {os.path.join(_RE_DIR, name) for name in ("re.py", "sre_compile.py", "sre_parse.py")}
+
+
+def _is_regex_function(key):
+    filename, _, funcname = key
+    if filename == "~":
+        return "re.Pattern" in funcname
+    path = os.path.abspath(filename)
+    if _RE_IS_PACKAGE:
+        return os.path.dirname(path) == _RE_DIR
+    return path in _RE_FILES
+
+
+def stage_breakdown(stats):
+    """
+    pstats.Stats 에서 크롤러 모듈(crawler_*.py)별 단계 시간(초)을 계산해
+    {모듈 이름: {단계: 초}} 로 반환합니다. 단계는 STAGES 를 참고하세요.
+    """
+    breakdown = {}
+    entries = stats.stats
+    for key, (_, _, _, cumtime, _) in entries.items():
+        filename, _, funcname = key
+        module = os.path.splitext(os.path.basename(filename))[0]
+        if not module.startswith("crawler_") or funcname not in ("fetch_page", "parse_page"):
+            continue
+        stages = breakdown.setdefault(module, dict.fromkeys(STAGES, 0.0))
+        if funcname == "fetch_page":
+            stages["네트워크 대기"] += cumtime
+        else:
+            stages["행 추출"] += cumtime
+
+    # parse_page 가 직접 호출한 make_soup 와 정규식 함수의 시간을 행 추출에서 떼어 냅니다.
+    for key, (_, _, _, _, callers) in entries.items():
+        filename, _, funcname = key
+        is_soup = funcname == "make_soup" and filename.endswith("html_parsing.py")
+        is_regex = _is_regex_function(key)
+        if not (is_soup or is_regex):
+            continue
+        for caller, caller_stats in callers.items():
+            caller_file, _, caller_func = caller
+            module = os.path.splitext(os.path.basename(caller_file))[0]
+            if caller_func != "parse_page" or module not in breakdown:
+                continue
+            cumtime = caller_stats[3]
+            stage = "HTML 파싱" if is_soup else "정규식 링크 생성"
+            breakdown[module][stage] += cumtime
+            breakdown[module]["행 추출"] -= cumtime
+
+    for stages in breakdown.values():
+        stages["행 추출"] = max(0.0, stages["행 추출"])
+    return breakdown
+
+
+def format_breakdown(breakdown, labels=None):
+    """stage_breakdown 결과를 표 형태의 문자열로 만듭니다. labels 는 {모듈 이름: 표시 이름} 입니다."""
+    labels = labels or {}
+    header = f"{'기관':<12}" + "".join(f"{stage:>14}" for stage in STAGES) + f"{'합계':>10}"
+    lines = [header]
+    totals = dict.fromkeys(STAGES, 0.0)
+    for module, stages in sorted(breakdown.items()):
+        total = sum(stages.values())
+        lines.append(
+            f"{labels.get(module, module):<12}"
+            + "".join(f"{stages[stage]:>13.2f}s" for stage in STAGES)
+            + f"{total:>9.2f}s"
+        )
+        for stage in STAGES:
+            totals[stage] += stages[stage]
+    grand_total = sum(totals.values()) or 1.0
+    lines.append(
+        f"{'비율':<12}" + "".join(f"{totals[stage] / grand_total:>13.1%} " for stage in STAGES)
+    )
+    return "\n".join(lines)
+
+
+@contextmanager
+def profiled(name, output_dir=None, labels=None):
+    """
+    with 블록 실행을 프로파일링해 output_dir(기본 PROFILE_DIR)에 <name>.prof 와 <name>.stages.json 을 저장하고
+    단계별 소요 시간 표를 출력합니다. labels 는 표에 쓸 {모듈 이름: 표시 이름} 입니다.
+    """
+    global _enabled
+    output_dir = output_dir or PROFILE_DIR
+    profiler = cProfile.Profile()
+    _enabled = True
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        wall = time.perf_counter() - start
+        _enabled = False
+
+        stats = pstats.Stats(profiler)
+        os.makedirs(output_dir, exist_ok=True)
+        prof_path = os.path.join(output_dir, f"{name}.prof")
+        stats.dump_stats(prof_path)
+
+        breakdown = stage_breakdown(stats)
+        with open(os.path.join(output_dir, f"{name}.stages.json"), "w", encoding="utf-8") as f:
+            json.dump({"wall_seconds": wall, "stages": breakdown}, f, ensure_ascii=False, indent=2)
+        print(f"\n[프로파일] {name}: 전체 {wall:.2f}초 (요청을 하나씩 보내고 파싱 프로세스 풀은 쓰지 않고 측정)")
+        print(format_breakdown(breakdown, labels))
+        print(f"프로파일 저장: {prof_path} (예: snakeviz {prof_path} 또는 python -m pstats {prof_path})")
+
+
+@contextmanager
+def profile_if_requested(name):
+    """
+    명령행 인자에 --profile 이 있으면 with 블록을 profiled(name) 으로 측정하고, 없으면 그냥 실행합니다.
+    크롤러 모듈의 `if __name__ == "__main__":` 블록에서 사용합니다.
+    """
+    if "--profile" in sys.argv[1:]:
+        with profiled(name):
+            yield
+    else:
+        yield
+
+
+def main():
+    from agencies import AGENCY_NAMES, CRAWLER_MODULES, SCRAPE_FUNCS
+
+    parser = argparse.ArgumentParser(description="여러 기관을 차례로 크롤링하며 프로파일링합니다.")
+    parser.add_argument("--agency", choices=list(SCRAPE_FUNCS), action="append",
+                        help="프로파일링할 기관 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--name", default="all", help="저장할 프로파일 이름 (기본: all)")
+    parser.add_argument("--output-dir", default=PROFILE_DIR, help=f"저장 디렉터리 (기본: {PROFILE_DIR})")
+    args = parser.parse_args()
+
+    agencies = args.agency or list(SCRAPE_FUNCS)
+    labels = {CRAWLER_MODULES[key].__name__: AGENCY_NAMES[key] for key in agencies}
+    logging.disable(logging.INFO)
+    with profiled(args.name, args.output_dir, labels):
+        # cProfile 하나로 측정하므로 기관도 스레드를 나누지 않고 차례로 크롤링합니다.
+        for key in agencies:
+            SCRAPE_FUNCS[key]()
+
+
+if __name__ == "__main__":
+    # 스크립트로 실행하면 이 파일이 __main__ 모듈이 되므로, crawler_common 이 가져가는 profiling 모듈과
+    # 같은 상태(_enabled 등)를 쓰도록 모듈로 다시 가져와 실행합니다.
+    import profiling
+    profiling.main()
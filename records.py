@@ -0,0 +1,116 @@
+"""
+공지사항 게시글의 메모리 표현입니다.
+
+- Announcement: 크롤러가 만드는 게시글 하나. __slots__ 를 써서 한글 키 딕셔너리보다 작고,
+  반복해서 나오는 기관 키와 부서명은 sys.intern 으로 같은 문자열 객체를 함께 씁니다.
+- RecordBatch: 저장소에서 읽은 게시글들을 열(column) 단위 리스트로 담습니다.
+  SQL 결과를 행마다 딕셔너리로 바꾸지 않고 열 리스트를 그대로 DataFrame 열로 넘깁니다.
+  파싱 프로세스가 결과를 돌려줄 때도 이 형태로 보냅니다. (crawler_common.parse_in_order 참고)
+"""
+import sys
+
+# 게시글 필드와 화면(DataFrame)에 쓰는 열 이름. DataFrame 열 순서도 이 순서를 따릅니다.
+COLUMN_NAMES = {
+    "title": "제목",
+    "reg_date": "등록일",
+    "agency": "기관",
+    "link": "링크",
+    "department": "부서명",
+    "post_id": "게시글ID",
+}
+
+# 값이 없을 수 있는 필드 (RecordBatch.to_frame 참고)
+OPTIONAL_FIELDS = ("agency", "department")
+
+
+def _intern(value):
+    return sys.intern(value) if value else value
+
+
+class Announcement:
+    """
+    게시글 하나. agency 는 기관 키(저장소에서 읽을 때만 채움), department 는 부서명이 있는 기관(기획재정부)만 채웁니다.
+    필드 값이 모두 같으면 같은 게시글로 봅니다.
+    """
+    __slots__ = ("title", "reg_date", "link", "post_id", "department", "agency")
+
+    def __init__(self, title="", reg_date="", link="", post_id="", department=None, agency=None):
+        self.title = title
+        self.reg_date = reg_date
+        self.link = link
+        self.post_id = post_id
+        self.department = _intern(department)
+        self.agency = _intern(agency)
+
+    def astuple(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if not isinstance(other, Announcement):
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__ if getattr(self, name) is not None
+        )
+        return f"Announcement({fields})"
+
+
+class RecordBatch:
+    """
+    게시글들을 필드별 리스트(columns: {필드: 리스트})로 담은 묶음입니다. 모든 리스트의 길이는 같습니다.
+
+        batch = store.load_batch("moef")
+        df = batch.to_frame()   # 열 이름은 COLUMN_NAMES 의 한글 이름
+    """
+    __slots__ = ("columns",)
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, fields, rows):
+        """fields 순서의 튜플 rows(예: SQL 결과)를 열 단위로 바꿉니다. 기관 키와 부서명은 intern 합니다."""
+        values = list(zip(*rows)) if rows else [()] * len(fields)
+        columns = {}
+        for field, column in zip(fields, values):
+            if field in OPTIONAL_FIELDS:
+                columns[field] = [_intern(value) for value in column]
+            else:
+                columns[field] = list(column)
+        return cls(columns)
+
+    @classmethod
+    def from_records(cls, records):
+        """Announcement 리스트를 열 단위로 바꿉니다. (프로세스 사이로 보낼 때 객체마다 필드 이름을 싣지 않도록)"""
+        return cls({field: [getattr(record, field) for record in records] for field in Announcement.__slots__})
+
+    def to_records(self):
+        """열 단위 게시글을 Announcement 리스트로 되돌립니다."""
+        fields = list(self.columns)
+        return [Announcement(**dict(zip(fields, values))) for values in zip(*self.columns.values())]
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def to_frame(self):
+        """
+        COLUMN_NAMES 순서와 이름으로 DataFrame 을 만듭니다.
+        기관 키와 부서명 열은 값이 모두 None 이면(기관별 보기, 부서명이 없는 기관) 뺍니다.
+        pandas 3 은 문자열 리스트를 기본으로 Arrow 문자열 열(str)로 바꾸며 모든 문자열을 버퍼로 복사하므로,
+        object 열로 만들어 DataFrame 이 리스트의 문자열 객체(intern 한 기관 키와 부서명 포함)를 그대로 가리키게 합니다.
+        """
+        import pandas as pd  # 크롤링 워커는 pandas 없이 이 모듈을 쓰므로 필요할 때만 가져옵니다.
+
+        data = {}
+        for field, name in COLUMN_NAMES.items():
+            column = self.columns.get(field)
+            if column is None:
+                continue
+            if field in OPTIONAL_FIELDS and all(value is None for value in column):
+                continue
+            data[name] = column
+        return pd.DataFrame(data, dtype=object)
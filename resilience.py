@@ -0,0 +1,311 @@
+"""
+모든 크롤러가 함께 쓰는 요청 재시도/속도 제한/차단기(circuit breaker) 계층입니다.
+
+request(method, url, ...) 는 http_client 로 요청을 보내면서
+- 호스트별 속도 제한: 같은 기관에 초당 HOST_RATE_LIMITS 회를 넘게 요청하지 않습니다.
+- 재시도: 연결 오류, 타임아웃, 429/5xx 응답은 MAX_RETRIES 회까지 지수 백오프(+무작위 지연)로 다시 시도합니다.
+  응답에 Retry-After 헤더가 있으면 그 시간만큼 기다립니다.
+- 차단기: 한 호스트에서 연속 FAILURE_THRESHOLD 회 실패하면 RESET_TIMEOUT 초 동안 그 호스트로의 요청을
+  보내지 않고 바로 CircuitOpenError 를 냅니다. 이후 요청 하나로 회복 여부를 확인합니다.
+  장애가 난 기관 하나가 재시도로 전체 크롤링을 붙잡고 있지 않도록 빨리 실패시키기 위한 것입니다.
+
+호스트는 요청 주소의 원래 호스트(대역 서버로 바꾸기 전) 기준이므로 벤치마크에서도 기관별로 따로 동작합니다.
+
+conditional(etag, last_modified) 블록 안의 GET 요청에는 If-None-Match/If-Modified-Since 헤더를 붙이고,
+응답의 ETag/Last-Modified 와 304 Not Modified 여부를 돌려줍니다. (crawler_common.PageCache 참고)
+"""
+import os
+import time
+import random
+import logging
+import datetime
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+import metrics
+import http_client
+
+# 재시도 횟수 (첫 요청 제외)
+MAX_RETRIES = 3
+
+# 지수 백오프: n 번째 재시도 전 0 ~ min(BACKOFF_MAX, BACKOFF_BASE * 2**n) 초 사이를 무작위로 기다립니다.
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+# Retry-After 가 이 시간(초)보다 길면 기다리지 않고 그 시간 동안 차단기를 엽니다.
+MAX_RETRY_AFTER = 60.0
+
+# 다시 시도할 HTTP 상태 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# 연속 실패가 이 횟수에 이르면 차단기를 엽니다.
+FAILURE_THRESHOLD = 5
+
+# 차단기를 연 뒤 회복 확인 요청을 보내기까지 기다리는 시간(초)
+RESET_TIMEOUT = 60.0
+
+# 기본 요청 타임아웃(초). 요청 시 timeout 을 주지 않으면 사용합니다.
+DEFAULT_TIMEOUT = 10
+
+# 호스트별 초당 최대 요청 수. 목록에 없는 호스트는 DEFAULT_RATE_LIMIT 을 사용하며, 0 이면 제한하지 않습니다.
+# 환경변수 CRAWLER_RATE_LIMIT 로 기본값을 바꿀 수 있습니다.
+DEFAULT_RATE_LIMIT = float(os.environ.get("CRAWLER_RATE_LIMIT", "10"))
+
+HOST_RATE_LIMITS = {
+    "www.moef.go.kr": 8,
+    "www.nts.go.kr": 8,
+    "www.customs.go.kr": 8,
+    "www.pps.go.kr": 12,
+    "sri.kostat.go.kr": 8,
+}
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 요청을 보내지 않았을 때 발생합니다. 크롤링 전체를 중단시키기 위해 requests 예외와 구분합니다."""
+
+
+class CircuitBreaker:
+    """호스트 하나의 차단기. closed(정상) → open(차단) → half-open(회복 확인) 상태를 오갑니다."""
+
+    def __init__(self, host):
+        self.host = host
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_until = 0.0
+        self.probing = False
+
+    def before_request(self):
+        """요청을 보내도 되는지 확인합니다. 차단 중이면 CircuitOpenError 를 냅니다."""
+        with self.lock:
+            if self.opened_until == 0.0:
+                return
+            remaining = self.opened_until - time.time()
+            if remaining > 0 or self.probing:
+                raise CircuitOpenError(
+                    f"{self.host} 요청 차단 중 (연속 {self.failures}회 실패, {max(remaining, 0):.0f}초 후 재확인)"
+                )
+            # 차단 시간이 지났으면 이 요청 하나로 회복 여부를 확인합니다.
+            self.probing = True
+
+    def record_success(self):
+        with self.lock:
+            if self.opened_until:
+                logging.info(f"{self.host} 요청 차단 해제")
+            self.failures = 0
+            self.opened_until = 0.0
+            self.probing = False
+
+    def record_failure(self, open_for=None):
+        """
+        실패를 기록합니다. 연속 실패가 FAILURE_THRESHOLD 에 이르거나 회복 확인 요청이 실패하면 차단기를 엽니다.
+        open_for 가 주어지면 (예: 긴 Retry-After) 실패 횟수와 관계없이 그 시간 동안 엽니다.
+        """
+        with self.lock:
+            self.failures += 1
+            if open_for is None and (self.probing or self.failures >= FAILURE_THRESHOLD):
+                open_for = RESET_TIMEOUT
+            self.probing = False
+            if open_for is not None:
+                self.opened_until = time.time() + open_for
+                logging.warning(f"{self.host} 요청 차단: 연속 {self.failures}회 실패, {open_for:.0f}초 동안 요청하지 않습니다.")
+
+
+class RateLimiter:
+    """호스트 하나에 대한 요청 간격 제한. 여러 스레드가 함께 써도 초당 rate 회를 넘지 않습니다."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def acquire(self):
+        """요청을 보내도 될 때까지 기다리고, 기다린 시간(초)을 반환합니다."""
+        if not self.rate:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + 1.0 / self.rate
+        if start > now:
+            time.sleep(start - now)
+        return start - now
+
+
+class Validators:
+    """
+    조건부 요청의 검증 값. 요청 전에는 보낼 ETag/Last-Modified 를, 요청 후에는 응답에서 받은 값과
+    304 Not Modified 여부(not_modified)를 담습니다.
+    """
+    __slots__ = ("etag", "last_modified", "not_modified")
+
+    def __init__(self, etag=None, last_modified=None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.not_modified = False
+
+
+_breakers = {}
+_limiters = {}
+_rate_override = None
+_lock = threading.Lock()
+_conditional = threading.local()
+
+
+def _host(url):
+    return urlparse(url).hostname or ""
+
+
+def get_breaker(url):
+    """url 호스트의 차단기를 반환합니다."""
+    host = _host(url)
+    with _lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def get_rate_limiter(url):
+    """url 호스트의 속도 제한기를 반환합니다."""
+    host = _host(url)
+    with _lock:
+        if host not in _limiters:
+            rate = _rate_override if _rate_override is not None else HOST_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+            _limiters[host] = RateLimiter(rate)
+        return _limiters[host]
+
+
+def set_rate_limit(rate):
+    """
+    모든 호스트의 초당 최대 요청 수를 rate 로 바꿉니다. (0 이면 제한 없음)
+    None 을 넘기면 HOST_RATE_LIMITS 설정으로 되돌립니다.
+    """
+    global _rate_override
+    with _lock:
+        _rate_override = rate
+        _limiters.clear()
+
+
+def reset():
+    """모든 호스트의 차단기와 속도 제한 상태를 초기화합니다."""
+    with _lock:
+        _breakers.clear()
+        _limiters.clear()
+
+
+@contextmanager
+def conditional(etag=None, last_modified=None):
+    """
+    이 스레드에서 with 블록 안에 보내는 GET 요청을 조건부 요청으로 만들고 Validators 를 돌려줍니다.
+    서버가 304 로 답하면 request 는 본문이 빈 응답을 그대로 반환하고 validators.not_modified 가 True 가 됩니다.
+    (POST 요청은 조건부로 보내지 않습니다.)
+    """
+    validators = Validators(etag, last_modified)
+    _conditional.current = validators
+    try:
+        yield validators
+    finally:
+        _conditional.current = None
+
+
+def _apply_conditional(method, kwargs):
+    validators = getattr(_conditional, "current", None)
+    if validators is None or method.upper() != "GET":
+        return None
+    headers = dict(kwargs.get("headers") or {})
+    if validators.etag:
+        headers["If-None-Match"] = validators.etag
+    if validators.last_modified:
+        headers["If-Modified-Since"] = validators.last_modified
+    kwargs["headers"] = headers
+    return validators
+
+
+def retry_after_seconds(response):
+    """응답의 Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 반환합니다. 없거나 해석할 수 없으면 None."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt):
+    """attempt 번째(0부터) 재시도 전에 기다릴 시간(초). 지수 백오프에 전체 무작위 지연(full jitter)을 적용합니다."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def request(method, url, **kwargs):
+    """
+    공유 세션으로 요청을 보내고 성공한 응답을 반환합니다. 인자는 requests.request 와 같습니다.
+
+    - 재시도할 만한 실패(연결 오류, 타임아웃, 429/5xx)는 MAX_RETRIES 회까지 다시 시도하고,
+      끝내 실패하면 마지막 requests 예외를 그대로 냅니다.
+    - 그 밖의 4xx 응답은 다시 시도하지 않고 requests.HTTPError 를 냅니다.
+    - 호스트의 차단기가 열려 있으면 요청하지 않고 CircuitOpenError 를 냅니다.
+    - conditional() 블록 안이면 조건부 요청을 보내고 304 응답도 성공으로 반환합니다.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    validators = _apply_conditional(method, kwargs)
+    send = http_client.post if method.upper() == "POST" else http_client.get
+    breaker = get_breaker(url)
+    limiter = get_rate_limiter(url)
+    host = _host(url)
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            breaker.before_request()
+        except CircuitOpenError:
+            metrics.inc("circuit_rejected", host)
+            raise
+        metrics.inc("rate_limit_wait_seconds", host, limiter.acquire())
+        response = None
+        start = time.perf_counter()
+        try:
+            response = send(url, **kwargs)
+            metrics.observe("request_seconds", host, time.perf_counter() - start)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            metrics.inc("request_errors", host)
+            status = response.status_code if response is not None else None
+            if status is not None and status not in RETRY_STATUSES:
+                # 요청 자체가 잘못된 경우(404 등)는 서버 장애가 아니므로 차단기에 반영하지 않습니다.
+                breaker.record_success()
+                raise
+            retry_after = retry_after_seconds(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                breaker.record_failure(open_for=retry_after)
+                raise
+            breaker.record_failure()
+            if attempt == MAX_RETRIES:
+                raise
+            delay = retry_after if retry_after is not None else backoff_delay(attempt)
+            metrics.inc("retries", host)
+            logging.warning(f"{host} 요청 실패: {e}. {delay:.1f}초 후 재시도 {attempt + 1}/{MAX_RETRIES}")
+            time.sleep(delay)
+        except Exception:
+            metrics.inc("request_errors", host)
+            breaker.record_failure()
+            raise
+        else:
+            breaker.record_success()
+            if validators is not None:
+                validators.not_modified = response.status_code == 304
+                validators.etag = response.headers.get("ETag") or validators.etag
+                validators.last_modified = response.headers.get("Last-Modified") or validators.last_modified
+                if validators.not_modified:
+                    metrics.inc("not_modified", host)
+            metrics.inc("requests", host)
+            metrics.inc("bytes", host, len(response.content))
+            metrics.observe("response_bytes", host, len(response.content))
+            return response
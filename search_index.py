@@ -0,0 +1,155 @@
+"""
+공지사항 제목 검색용 n-그램 역색인(TitleIndex)과 등록일 기간 검색용 날짜 색인(DateIndex)입니다.
+
+제목을 공백으로 나눈 단어마다 한 글자(유니그램)와 두 글자(바이그램) 조각을 만들어
+조각 → 행 번호 집합으로 색인합니다. 한국어는 띄어쓰기가 일정하지 않아 단어 단위 색인으로는
+"세법개정안" 에서 "개정" 을 찾을 수 없으므로 바이그램을 사용합니다.
+
+검색어의 조각들이 모두 들어 있는 행만 후보로 골라(작은 집합부터 교집합) 실제로 검색어가 포함되는지
+확인하므로, 전체 제목을 매번 훑는 str.contains 와 결과가 같으면서 훨씬 빠릅니다.
+두 글자 이하 키워드는 조각 자체가 키워드라 확인을 건너뜁니다. 화면은 입력할 때, 페이지를 넘길 때,
+크롤링 중 주기적으로 같은 검색을 다시 실행하므로 키워드별 행 집합과 검색어별 정렬된 결과를
+색인마다 CACHE_SIZE 개까지 캐시해 반복 검색은 교집합과 정렬 없이 바로 돌려줍니다.
+
+DateIndex 는 등록일 내림차순(최신순)으로 정렬된 행들의 날짜를 담아 두고,
+기간에 해당하는 행 범위를 이진 탐색(bisect)으로 찾습니다.
+"""
+import re
+import datetime
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+# 검색어 사이 결합 방식
+MODE_AND = "and"
+MODE_OR = "or"
+
+# TitleIndex 하나가 캐시하는 키워드별 행 집합과 검색어별 결과의 최대 개수
+CACHE_SIZE = 256
+
+_SPACES = re.compile(r"\s+")
+_EMPTY = frozenset()
+
+
+def normalize(text):
+    """대소문자를 구분하지 않도록 소문자로 바꾸고 연속된 공백을 하나로 줄입니다."""
+    return _SPACES.sub(" ", str(text)).strip().lower()
+
+
+def ngrams(word):
+    """공백 없는 단어의 유니그램과 바이그램 집합을 반환합니다."""
+    grams = set(word)
+    grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def split_keywords(query):
+    """검색어 문자열을 공백 기준으로 나눈 키워드 리스트를 반환합니다. (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(normalize(query).split()))
+
+
+class TitleIndex:
+    """
+    제목 리스트에 대한 n-그램 역색인. 행 번호는 titles 의 위치(0부터)입니다.
+
+        index = TitleIndex(df["제목"])
+        rows = index.search("부가세 신고", mode=MODE_AND)   # 두 단어를 모두 포함하는 행
+        df.iloc[rows]
+
+    색인은 만든 뒤 바뀌지 않으므로 여러 스레드(화면 세션)에서 함께 써도 됩니다. (캐시는 lru_cache 로 스레드 안전)
+    """
+
+    def __init__(self, titles):
+        self.titles = [normalize(title) for title in titles]
+        self.postings = {}
+        for row, title in enumerate(self.titles):
+            grams = set()
+            for word in title.split():
+                grams.update(ngrams(word))
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(row)
+        self.postings = {gram: frozenset(rows) for gram, rows in self.postings.items()}
+        self._keyword_rows = lru_cache(maxsize=CACHE_SIZE)(self._match)
+        self._search = lru_cache(maxsize=CACHE_SIZE)(self._search_sorted)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _candidates(self, keyword):
+        """
+        키워드의 n-그램을 모두 포함하는 행 번호 집합. 두 글자 이상이면 바이그램만 보면 되고(각 글자는 바이그램에 들어 있음),
+        작은 집합부터 교집합을 구합니다.
+        """
+        grams = ngrams(keyword) if len(keyword) < 2 else {keyword[i:i + 2] for i in range(len(keyword) - 1)}
+        postings = sorted((self.postings.get(gram, _EMPTY) for gram in grams), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def _match(self, keyword):
+        if len(keyword) <= 2:
+            # 한두 글자 키워드는 그 자체가 조각이므로 색인의 행 집합이 곧 결과입니다.
+            return self.postings.get(keyword, _EMPTY)
+        return frozenset(row for row in self._candidates(keyword) if keyword in self.titles[row])
+
+    def match_keyword(self, keyword):
+        """키워드(공백 없음)를 제목에 포함하는 행 번호 집합을 반환합니다."""
+        return set(self._keyword_rows(keyword))
+
+    def _search_sorted(self, keywords, mode):
+        if mode == MODE_OR:
+            return tuple(sorted(frozenset().union(*(self._keyword_rows(keyword) for keyword in keywords))))
+        # AND: 행이 적은 키워드부터 교집합을 구하고, 남는 행이 없으면 바로 끝냅니다.
+        matches = sorted((self._keyword_rows(keyword) for keyword in keywords), key=len)
+        rows = matches[0]
+        for match in matches[1:]:
+            if not rows:
+                break
+            rows = rows & match
+        return tuple(sorted(rows))
+
+    def search(self, query, mode=MODE_AND):
+        """
+        검색어를 공백으로 나눈 키워드들로 제목을 검색하여 일치하는 행 번호를 오름차순 리스트로 반환합니다.
+        mode 가 MODE_AND 이면 모든 키워드를, MODE_OR 이면 하나 이상의 키워드를 포함하는 행을 찾습니다.
+        검색어가 비어 있으면 모든 행을 반환합니다.
+        """
+        keywords = split_keywords(query)
+        if not keywords:
+            return list(range(len(self.titles)))
+        return list(self._search(tuple(keywords), MODE_OR if mode == MODE_OR else MODE_AND))
+
+
+def _date_key(value):
+    """
+    "YYYY-MM-DD" 날짜의 정렬 키. 최신 날짜일수록 작은 값(서수의 음수)이며,
+    날짜가 아니면 0 으로 모든 날짜보다 뒤에 둡니다.
+    """
+    try:
+        return -datetime.date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+class DateIndex:
+    """
+    등록일 내림차순으로 정렬된 행들의 날짜 색인. 행 번호는 dates 의 위치(0부터)입니다.
+    store.load_batch 의 순서(정규화한 등록일 내림차순, 날짜가 없는 행은 맨 뒤)를 그대로 받아야 합니다.
+
+        dates = DateIndex(df["등록일"])
+        lo, hi = dates.range(start, end)   # df.iloc[lo:hi] 가 기간 안의 행
+    """
+
+    def __init__(self, dates):
+        self.keys = [_date_key(value) for value in dates]
+
+    def range(self, start=None, end=None):
+        """
+        start ~ end (datetime.date, 양 끝 포함) 에 등록된 행의 위치 범위 (lo, hi) 를 반환합니다.
+        생략한 쪽은 제한하지 않으며, 날짜가 없는 행은 포함하지 않습니다.
+        """
+        lo = 0 if end is None else bisect_left(self.keys, -end.toordinal())
+        hi = bisect_left(self.keys, 0) if start is None else bisect_right(self.keys, -start.toordinal())
+        return lo, max(lo, hi)
+
+    def filter(self, rows, start=None, end=None):
+        """오름차순 행 번호 리스트 rows(예: TitleIndex.search 결과) 중 기간 안의 행만 반환합니다."""
+        lo, hi = self.range(start, end)
+        return rows[bisect_left(rows, lo):bisect_left(rows, hi)]
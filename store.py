@@ -0,0 +1,414 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+import datetime
+from contextlib import closing
+from crawler_common import PageCache, record_id, normalize_date
+from records import Announcement, RecordBatch
+
+# 크롤링 결과를 저장하는 SQLite 파일 경로 (환경변수 CRAWLER_DB_PATH 로 변경 가능)
+DATA_DIR = os.environ.get("CRAWLER_DATA_DIR", "data")
+DB_PATH = os.environ.get("CRAWLER_DB_PATH", os.path.join(DATA_DIR, "announcements.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS announcements (
+    agency      TEXT NOT NULL,
+    post_id     TEXT NOT NULL,
+    title       TEXT NOT NULL,
+    reg_date    TEXT NOT NULL,
+    reg_day     TEXT NOT NULL DEFAULT '',
+    link        TEXT NOT NULL,
+    department  TEXT,
+    first_seen  TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    seq         INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (agency, post_id)
+);
+CREATE INDEX IF NOT EXISTS idx_announcements_agency ON announcements (agency);
+CREATE INDEX IF NOT EXISTS idx_announcements_agency_date ON announcements (agency, reg_date);
+CREATE TABLE IF NOT EXISTS crawl_status (
+    agency       TEXT PRIMARY KEY,
+    state        TEXT NOT NULL,
+    full         INTEGER NOT NULL DEFAULT 0,
+    pages        INTEGER NOT NULL DEFAULT 0,
+    rows         INTEGER NOT NULL DEFAULT 0,
+    error        TEXT,
+    started_at   REAL,
+    updated_at   REAL,
+    finished_at  REAL,
+    snapshot_at  REAL,
+    total_pages  INTEGER
+);
+CREATE TABLE IF NOT EXISTS page_cache (
+    agency         TEXT NOT NULL,
+    page           INTEGER NOT NULL,
+    content_hash   TEXT NOT NULL,
+    etag           TEXT,
+    last_modified  TEXT,
+    post_ids       TEXT NOT NULL,
+    updated_at     REAL NOT NULL,
+    PRIMARY KEY (agency, page)
+);
+CREATE TABLE IF NOT EXISTS changes (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    agency       TEXT NOT NULL,
+    post_id      TEXT NOT NULL,
+    kind         TEXT NOT NULL,
+    title        TEXT NOT NULL,
+    old_title    TEXT,
+    link         TEXT,
+    detected_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_changes_detected ON changes (detected_at);
+CREATE TABLE IF NOT EXISTS visitors (
+    visitor  TEXT PRIMARY KEY,
+    seen_at  REAL NOT NULL
+);
+"""
+
+# 변경 기록(changes 테이블)의 종류: 새 게시글, 게시판에서 사라진 게시글, 제목이 바뀐 게시글
+CHANGE_NEW = "new"
+CHANGE_REMOVED = "removed"
+CHANGE_TITLE = "title"
+
+# 방문자의 변경 확인 기록(visitors 테이블)을 보관하는 기간(일). 확인 시각이 이보다 오래된 방문자는 지웁니다.
+VISITOR_RETENTION = 180
+
+# 기존 저장소 파일에 나중에 추가된 컬럼: {테이블: {컬럼: 정의}}
+ADDED_COLUMNS = {
+    "announcements": {"seq": "INTEGER NOT NULL DEFAULT 0", "reg_day": "TEXT NOT NULL DEFAULT ''"},
+    "crawl_status": {"snapshot_at": "REAL", "total_pages": "INTEGER", "full_snapshot_at": "REAL"},
+}
+
+# 추가된 컬럼을 사용하는 인덱스. 컬럼 추가가 끝난 뒤에 만듭니다.
+ADDED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_announcements_agency_day ON announcements (agency, reg_day);
+CREATE INDEX IF NOT EXISTS idx_announcements_day ON announcements (reg_day, seq);
+"""
+
+_initialized = set()
+_init_lock = threading.Lock()
+
+
+def connect():
+    """
+    저장소에 연결합니다. 처음 연결할 때 디렉터리와 테이블, 인덱스를 만듭니다.
+    여러 프로세스가 동시에 읽고 쓸 수 있도록 WAL 모드를 사용합니다.
+    """
+    if DB_PATH != ":memory:":
+        os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    # 기관별 크롤링 스레드가 동시에 처음 연결해도 테이블 생성과 컬럼 추가는 한 번만 실행합니다.
+    with _init_lock:
+        if DB_PATH not in _initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            for table, added in ADDED_COLUMNS.items():
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for column, definition in added.items():
+                    if column not in columns:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            conn.executescript(ADDED_INDEXES)
+            _backfill_reg_day(conn)
+            _initialized.add(DB_PATH)
+    return conn
+
+
+def _backfill_reg_day(conn):
+    """reg_day 컬럼이 추가되기 전에 저장된 게시글의 등록일을 정규화해 채웁니다."""
+    rows = conn.execute("SELECT rowid, reg_date FROM announcements WHERE reg_day = ''").fetchall()
+    updates = [(normalize_date(reg_date), rowid) for rowid, reg_date in rows]
+    updates = [(reg_day, rowid) for reg_day, rowid in updates if reg_day]
+    if updates:
+        with conn:
+            conn.executemany("UPDATE announcements SET reg_day = ? WHERE rowid = ?", updates)
+
+
+def new_crawl_seq():
+    """
+    크롤링 한 번의 시작 순번을 반환합니다. 나중에 시작한 크롤링일수록 큰 값이며,
+    한 크롤링 안에서는 게시판 위쪽(최신) 게시글부터 이 값에서 1씩 줄여 가며 저장합니다.
+    """
+    return int(time.time() * 1000) * 1_000_000
+
+
+def _upsert(conn, agency, records, seq):
+    now = datetime.datetime.now().isoformat(timespec="seconds")
+    rows = [
+        (
+            agency,
+            record_id(record),
+            record.title,
+            record.reg_date,
+            normalize_date(record.reg_date),
+            record.link,
+            record.department,
+            now,
+            now,
+            seq - position,
+        )
+        for position, record in enumerate(records)
+    ]
+    conn.executemany(
+        """
+        INSERT INTO announcements
+            (agency, post_id, title, reg_date, reg_day, link, department, first_seen, updated_at, seq)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (agency, post_id) DO UPDATE SET
+            title = excluded.title,
+            reg_date = excluded.reg_date,
+            reg_day = excluded.reg_day,
+            link = excluded.link,
+            department = excluded.department,
+            updated_at = excluded.updated_at
+        """,
+        rows,
+    )
+    return len(rows)
+
+
+def upsert_records(agency, records, seq=None):
+    """
+    기관의 게시글들을 (기관, 게시글ID) 기준으로 저장합니다.
+    이미 있는 게시글은 제목, 등록일, 링크, 부서명만 갱신하고 처음 수집한 시각과 순번은 유지합니다.
+
+    seq 는 records[0] 의 게시판 순번입니다. (new_crawl_seq 참고) 생략하면 새 순번을 사용합니다.
+    페이지 단위로 나누어 저장할 때는 앞서 저장한 건수만큼 뺀 값을 넘기면 됩니다.
+    """
+    if seq is None:
+        seq = new_crawl_seq()
+    with closing(connect()) as conn, conn:
+        return _upsert(conn, agency, records, seq)
+
+
+def diff_records(previous, records, replace=False):
+    """
+    이전 게시글 {게시글ID: (제목, 링크)} 와 새로 크롤링한 records 를 게시글ID로 비교해
+    변경 목록 [(게시글ID, 종류, 제목, 이전 제목, 링크)] 를 반환합니다. 종류는 CHANGE_* 값입니다.
+    사라진 게시글은 게시판 전체를 크롤링한 결과(replace=True)일 때만 찾습니다.
+    """
+    current = {record_id(record): record for record in records}
+    changes = []
+    for post_id, record in current.items():
+        old = previous.get(post_id)
+        if old is None:
+            changes.append((post_id, CHANGE_NEW, record.title, None, record.link))
+        elif old[0] != record.title:
+            changes.append((post_id, CHANGE_TITLE, record.title, old[0], record.link))
+    if replace:
+        changes.extend(
+            (post_id, CHANGE_REMOVED, title, None, link)
+            for post_id, (title, link) in previous.items() if post_id not in current
+        )
+    return changes
+
+
+def apply_snapshot(agency, records, seq=None, replace=False):
+    """
+    갱신 크롤링 결과를 한 트랜잭션으로 반영합니다. 반영이 끝나기 전까지 읽는 쪽은 이전 데이터를 그대로 보고,
+    커밋되는 순간 새 데이터로 한 번에 바뀝니다.
+    replace=True 이면 records 에 없는 기존 게시글(게시판에서 삭제된 글)도 지웁니다.
+
+    반영 전 데이터와 게시글ID로 비교한 변경(diff_records)은 같은 트랜잭션에서 changes 테이블에 덧붙입니다.
+    변경 종류별 건수 {CHANGE_*: 건수} 를 반환합니다.
+    """
+    if seq is None:
+        seq = new_crawl_seq()
+    with closing(connect()) as conn, conn:
+        previous = {
+            post_id: (title, link)
+            for post_id, title, link in conn.execute(
+                "SELECT post_id, title, link FROM announcements WHERE agency = ?", (agency,)
+            )
+        }
+        changes = diff_records(previous, records, replace)
+        _upsert(conn, agency, records, seq)
+        if replace:
+            removed = [(agency, post_id) for post_id, kind, *_ in changes if kind == CHANGE_REMOVED]
+            conn.executemany("DELETE FROM announcements WHERE agency = ? AND post_id = ?", removed)
+        now = time.time()
+        conn.executemany(
+            """
+            INSERT INTO changes (agency, post_id, kind, title, old_title, link, detected_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [(agency, *change, now) for change in changes],
+        )
+    counts = dict.fromkeys((CHANGE_NEW, CHANGE_REMOVED, CHANGE_TITLE), 0)
+    for _, kind, *_ in changes:
+        counts[kind] += 1
+    return counts
+
+
+def load_changes(since=None, agency=None):
+    """
+    since(유닉스 시각) 이후에 기록된 변경을 최신순 딕셔너리 리스트로 반환합니다.
+    since 가 None 이면 전체 기록, agency 가 None 이면 모든 기관의 기록입니다.
+    """
+    conditions, params = ["detected_at > ?"], [since or 0]
+    if agency is not None:
+        conditions.append("agency = ?")
+        params.append(agency)
+    with closing(connect()) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            f"SELECT * FROM changes WHERE {' AND '.join(conditions)} ORDER BY id DESC", params
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def load_seen_at(visitor):
+    """방문자(visitor)가 변경 기록을 마지막으로 확인한 시각을 반환합니다. 확인한 적이 없으면 None 을 반환합니다."""
+    with closing(connect()) as conn:
+        row = conn.execute("SELECT seen_at FROM visitors WHERE visitor = ?", (visitor,)).fetchone()
+    return row[0] if row else None
+
+
+def save_seen_at(visitor, seen_at, now=None):
+    """
+    방문자가 seen_at 까지의 변경을 확인했다고 기록합니다. 이미 더 나중까지 확인했으면 그대로 둡니다.
+    방문자 기록은 확인할 때만 만들고, 확인 시각이 VISITOR_RETENTION 일보다 오래된 기록은 이때 지웁니다.
+    """
+    now = time.time() if now is None else now
+    with closing(connect()) as conn, conn:
+        conn.execute(
+            """
+            INSERT INTO visitors (visitor, seen_at) VALUES (?, ?)
+            ON CONFLICT (visitor) DO UPDATE SET seen_at = MAX(seen_at, excluded.seen_at)
+            """,
+            (visitor, seen_at),
+        )
+        conn.execute("DELETE FROM visitors WHERE seen_at < ?", (now - VISITOR_RETENTION * 86400,))
+
+
+def load_batch(agency=None):
+    """
+    기관의 게시글을 최신순(등록일 내림차순, 같은 날이면 게시판 순서)으로 records.RecordBatch 에 담아 반환합니다.
+    등록일은 저장할 때 정규화한 "YYYY-MM-DD" 값입니다. (정규화하지 못한 날짜는 원래 문자열)
+    SQL 결과를 행마다 객체로 만들지 않고 열 단위 리스트로 바로 옮깁니다.
+
+    agency 가 None 이면 모든 기관의 게시글을 같은 기준으로 합쳐 반환하고, agency 필드에 기관 키를 채웁니다.
+    """
+    where, params = ("WHERE agency = ?", (agency,)) if agency is not None else ("", ())
+    fields = ("title", "reg_date", "link", "department", "post_id") + (("agency",) if agency is None else ())
+    with closing(connect()) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT title, COALESCE(NULLIF(reg_day, ''), reg_date), link, department, post_id
+                {", agency" if agency is None else ""}
+            FROM announcements
+            {where}
+            ORDER BY reg_day DESC, seq DESC
+            """,
+            params,
+        ).fetchall()
+    return RecordBatch.from_rows(fields, rows)
+
+
+def count_records(agency):
+    """기관에 대해 저장된 게시글 수를 반환합니다."""
+    with closing(connect()) as conn:
+        (count,) = conn.execute("SELECT COUNT(*) FROM announcements WHERE agency = ?", (agency,)).fetchone()
+        return count
+
+
+def data_version(agency=None):
+    """
+    기관 데이터가 바뀌었는지 판단하는 값을 반환합니다. (게시글 수, 마지막 갱신 시각, 최대 순번)
+    값이 같으면 화면에서 만든 표와 검색 색인을 다시 만들지 않고 그대로 씁니다.
+    agency 가 None 이면 모든 기관을 합친 값을 반환합니다.
+    """
+    where, params = ("WHERE agency = ?", (agency,)) if agency is not None else ("", ())
+    with closing(connect()) as conn:
+        return conn.execute(
+            f"SELECT COUNT(*), MAX(updated_at), MAX(seq) FROM announcements {where}", params
+        ).fetchone()
+
+
+def known_ids(agency):
+    """기관에 대해 저장된 게시글 ID 집합을 반환합니다."""
+    with closing(connect()) as conn:
+        rows = conn.execute("SELECT post_id FROM announcements WHERE agency = ?", (agency,))
+        return {post_id for (post_id,) in rows}
+
+
+def load_page_cache(agency):
+    """
+    기관 목록 페이지별 지난 크롤링 결과를 crawler_common.PageCache 로 반환합니다.
+    페이지에 있던 게시글은 바뀌지 않은 페이지를 처음 만났을 때 저장소에서 한 번에 읽습니다.
+    """
+    with closing(connect()) as conn:
+        rows = conn.execute(
+            "SELECT page, content_hash, etag, last_modified, post_ids FROM page_cache WHERE agency = ?", (agency,)
+        ).fetchall()
+    entries = {
+        page: (content_hash, etag, last_modified, json.loads(post_ids))
+        for page, content_hash, etag, last_modified, post_ids in rows
+    }
+
+    def load_records():
+        with closing(connect()) as conn:
+            rows = conn.execute(
+                "SELECT post_id, title, reg_date, link, department FROM announcements WHERE agency = ?", (agency,)
+            )
+            return {
+                post_id: Announcement(title, reg_date, link, post_id, department)
+                for post_id, title, reg_date, link, department in rows
+            }
+
+    return PageCache(entries, load_records)
+
+
+def save_page_cache(agency, entries, last_page=None):
+    """
+    PageCache.updated 의 페이지별 결과를 저장합니다.
+    last_page 가 주어지면 게시판이 줄어 더 이상 없는 페이지의 기록을 지웁니다.
+    """
+    now = time.time()
+    rows = [
+        (agency, page, content_hash, etag, last_modified, json.dumps(post_ids, ensure_ascii=False), now)
+        for page, (content_hash, etag, last_modified, post_ids) in entries.items()
+    ]
+    with closing(connect()) as conn, conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO page_cache
+                (agency, page, content_hash, etag, last_modified, post_ids, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        if last_page is not None:
+            conn.execute("DELETE FROM page_cache WHERE agency = ? AND page > ?", (agency, last_page))
+
+
+def save_crawl_status(agency, **fields):
+    """
+    기관의 크롤링 진행 상황을 기록합니다. (크롤링 워커가 쓰고 화면이 읽습니다.)
+    state 는 "running", "done", "error" 중 하나이며, 주어진 필드만 갱신합니다.
+    updated_at 은 항상 현재 시각으로 갱신되어 워커가 살아 있는지 판단하는 데 쓰입니다.
+    """
+    fields["updated_at"] = time.time()
+    columns = ", ".join(fields)
+    placeholders = ", ".join("?" for _ in fields)
+    assignments = ", ".join(f"{column} = ?" for column in fields)
+    with closing(connect()) as conn, conn:
+        cursor = conn.execute(
+            f"UPDATE crawl_status SET {assignments} WHERE agency = ?",
+            (*fields.values(), agency),
+        )
+        if cursor.rowcount == 0:
+            conn.execute(
+                f"INSERT INTO crawl_status (agency, {columns}) VALUES (?, {placeholders})",
+                (agency, *fields.values()),
+            )
+
+
+def load_crawl_status():
+    """기관별 크롤링 진행 상황을 {기관: 딕셔너리} 로 반환합니다."""
+    with closing(connect()) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute("SELECT * FROM crawl_status").fetchall()
+    return {row["agency"]: dict(row) for row in rows}
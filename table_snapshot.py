@@ -0,0 +1,122 @@
+"""
+기관별 공지사항 표를 열 단위(Arrow IPC) 파일로 저장해 두고, 화면(main.py)이 시작할 때 바로 읽어 쓰게 하는 모듈입니다.
+
+크롤링 워커가 기관 갱신을 마칠 때마다 그 기관과 전체 기관의 표를 SNAPSHOT_DIR/<기관>.arrow 로 씁니다.
+화면은 파일을 메모리 매핑(pyarrow.memory_map)해 DataFrame 으로 옮기므로, 저장소에서 행을 하나씩 읽어
+표를 만드는 대신 디스크 읽기만으로 첫 화면을 그릴 수 있습니다.
+
+파일에는 저장할 때의 store.data_version 값이 함께 기록되어, 저장소가 그 뒤에 바뀌었으면 파일을 쓰지 않고
+저장소에서 다시 읽습니다. pyarrow 가 설치되어 있지 않으면 파일을 쓰지도 읽지도 않습니다.
+
+사용법 (저장소 최상위에서):
+    python table_snapshot.py    # 저장소에 있는 모든 기관의 표 파일을 지금 다시 만듭니다.
+"""
+import os
+import json
+import logging
+import sqlite3
+import threading
+
+import store
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401  (pa.ipc 사용)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# 표 파일을 저장할 디렉터리 (환경변수 CRAWLER_SNAPSHOT_DIR 로 변경 가능)
+SNAPSHOT_DIR = os.environ.get("CRAWLER_SNAPSHOT_DIR", os.path.join(store.DATA_DIR, "snapshots"))
+
+# 전체 기관 표의 파일 이름
+ALL_NAME = "all"
+
+_VERSION_KEY = b"data_version"
+
+# 기관 크롤링이 동시에 끝나도 같은 파일(전체 기관 표)을 한 번에 하나씩, 읽은 순서대로 쓰게 합니다.
+_export_lock = threading.Lock()
+
+
+def snapshot_path(agency=None):
+    """기관(None 이면 전체 기관) 표 파일의 경로를 반환합니다."""
+    return os.path.join(SNAPSHOT_DIR, f"{agency or ALL_NAME}.arrow")
+
+
+def export_snapshot(agency=None):
+    """
+    저장소의 기관(None 이면 전체 기관) 게시글을 store.load_batch 와 같은 열로 표 파일에 씁니다.
+    읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 바꿔치기합니다.
+    쓴 게시글 수를 반환하며, pyarrow 가 없거나 게시글이 없으면 쓰지 않고 0 을 반환합니다.
+    """
+    if not HAS_PYARROW:
+        return 0
+    with _export_lock:
+        # 버전을 먼저 읽어 두면, 그 사이 저장소가 바뀌어도 파일의 버전이 내용보다 새것이 되지 않습니다.
+        version = store.data_version(agency)
+        if not version[0]:
+            return 0
+        df = store.load_batch(agency).to_frame()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({_VERSION_KEY: json.dumps(list(version)).encode("utf-8")})
+
+        path = snapshot_path(agency)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+        return len(df)
+
+
+def export_snapshots(agency):
+    """
+    기관 갱신이 끝난 뒤 그 기관과 전체 기관의 표 파일을 다시 씁니다.
+    표 파일은 빠른 시작을 위한 사본이므로 실패해도(파일 쓰기, Arrow 변환, 저장소 읽기 오류) 크롤링은
+    실패로 처리하지 않고 기록만 남깁니다. 화면은 표 파일이 없거나 오래되면 저장소에서 읽습니다.
+    """
+    for key in (agency, None):
+        try:
+            export_snapshot(key)
+        except (OSError, sqlite3.Error, pa.ArrowException) as e:
+            logging.warning(f"{key or ALL_NAME} 표 파일 저장 실패: {e}")
+
+
+def load_snapshot(agency=None, version=None):
+    """
+    기관(None 이면 전체 기관) 표 파일을 메모리 매핑해 DataFrame 으로 반환합니다.
+    version(store.data_version)이 주어지면 파일에 기록된 버전과 같을 때만 반환합니다.
+    파일이 없거나 버전이 다르거나 읽을 수 없으면(pyarrow 가 없는 경우 포함) None 을 반환합니다.
+    """
+    if not HAS_PYARROW:
+        return None
+    path = snapshot_path(agency)
+    try:
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+    except FileNotFoundError:
+        return None
+    except (OSError, pa.ArrowException) as e:
+        logging.warning(f"{path} 표 파일을 읽을 수 없습니다: {e}")
+        return None
+
+    saved = (table.schema.metadata or {}).get(_VERSION_KEY)
+    if version is not None and (saved is None or json.loads(saved) != list(version)):
+        return None
+    return table.to_pandas()
+
+
+def main():
+    from agencies import AGENCY_NAMES
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if not HAS_PYARROW:
+        logging.error("pyarrow 가 설치되어 있지 않아 표 파일을 만들 수 없습니다. (pip install pyarrow)")
+        return
+    for agency in (*AGENCY_NAMES, None):
+        count = export_snapshot(agency)
+        logging.info(f"{agency or ALL_NAME} 표 파일 저장: {count}건 → {snapshot_path(agency)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+테스트 공통 설정입니다. 크롤링은 benchmarks/stub_server.py 의 대역 서버와 기록된 목록 페이지(benchmarks/fixtures)로,
+저장소와 표 파일은 테스트마다 새 임시 디렉터리로 실행하므로 네트워크나 data/ 디렉터리를 건드리지 않습니다.
+
+실행 (저장소 최상위에서):
+    python -m pytest -q
+"""
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "benchmarks"))
+
+import store  # noqa: E402
+import metrics  # noqa: E402
+import resilience  # noqa: E402
+import http_client  # noqa: E402
+import table_snapshot  # noqa: E402
+from stub_server import start_server  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """대역 서버를 띄우고 모든 기관 요청을 그 서버로 보냅니다. 호스트별 속도 제한은 끕니다."""
+    server, base_url = start_server()
+    http_client.set_base_url_override(base_url)
+    resilience.set_rate_limit(0)
+    yield server
+    http_client.set_base_url_override(None)
+    resilience.set_rate_limit(None)
+    server.shutdown()
+
+
+@pytest.fixture
+def stub(stub_server):
+    """
+    테스트 하나에서 쓰는 대역 서버 설정(stub_server.StubConfig)입니다.
+    config.pages[(기관, 페이지)] 에 HTML(bytes)을 넣으면 그 페이지 대신 돌려줍니다. 테스트가 끝나면 되돌립니다.
+    """
+    config = stub_server.RequestHandlerClass.config
+    resilience.reset()
+    yield config
+    with config.lock:
+        config.pages.clear()
+        config.stats.clear()
+
+
+@pytest.fixture
+def data_store(tmp_path, monkeypatch):
+    """저장소(SQLite)와 표 파일을 임시 디렉터리에 만듭니다."""
+    monkeypatch.setattr(store, "DB_PATH", str(tmp_path / "announcements.db"))
+    monkeypatch.setattr(table_snapshot, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    metrics.reset()
+    return tmp_path
@@ -0,0 +1,82 @@
+import store
+import metrics
+import crawler_common
+import crawler_kostat
+from agencies import BOARDS
+from records import Announcement
+from crawl_state import crawl_incremental
+
+# 대역 서버의 통계청 게시판: 39페이지, 페이지당 10건 안팎
+AGENCY = "kostat"
+LAST_PAGE = 39
+
+
+def removed_count(agency):
+    return sum(1 for change in store.load_changes(agency=agency) if change["kind"] == store.CHANGE_REMOVED)
+
+
+def test_capped_full_crawl_keeps_posts_past_the_cap(stub, data_store, monkeypatch):
+    full_count = crawl_incremental(AGENCY, full=True)
+    assert store.count_records(AGENCY) == full_count
+    assert store.load_crawl_status()[AGENCY]["full_snapshot_at"]
+
+    # 게시판이 상한보다 길면 뒤쪽 게시글은 크롤링 결과에 없지만 삭제된 글이 아닙니다.
+    monkeypatch.setattr(crawler_common, "MAX_PAGES", 5)
+    crawl_incremental(AGENCY, full=True)
+    status = store.load_crawl_status()[AGENCY]
+    assert status["state"] == "done"
+    assert status["total_pages"] == 5
+    assert store.count_records(AGENCY) == full_count
+    assert removed_count(AGENCY) == 0
+
+
+def test_full_crawl_deletes_posts_gone_from_the_board(stub, data_store):
+    full_count = crawl_incremental(AGENCY, full=True)
+    store.upsert_records(AGENCY, [Announcement("사라진 글", "2020-01-01", "http://example.com/gone", "gone-1")])
+    crawl_incremental(AGENCY, full=True)
+    assert store.count_records(AGENCY) == full_count
+    assert removed_count(AGENCY) == 1
+
+
+def test_empty_page_keeps_every_post(stub, data_store):
+    full_count = crawl_incremental(AGENCY, full=True)
+    full_snapshot_at = store.load_crawl_status()[AGENCY]["full_snapshot_at"]
+    # 200 으로 받았지만 게시글이 없는 점검 안내 페이지
+    stub.pages[(AGENCY, 7)] = "<html><body><p>시스템 점검 중입니다.</p></body></html>".encode("utf-8")
+    crawl_incremental(AGENCY, full=True)
+    assert store.count_records(AGENCY) == full_count
+    assert removed_count(AGENCY) == 0
+    assert store.load_crawl_status()[AGENCY]["full_snapshot_at"] == full_snapshot_at
+
+
+def test_failed_page_keeps_every_post(stub, data_store, monkeypatch):
+    full_count = crawl_incremental(AGENCY, full=True)
+    fetch_page = crawler_kostat.fetch_page
+    monkeypatch.setattr(crawler_kostat, "fetch_page", lambda page: None if page == 7 else fetch_page(page))
+    crawl_incremental(AGENCY, full=True)
+    assert store.count_records(AGENCY) == full_count
+    assert removed_count(AGENCY) == 0
+
+
+def test_unchanged_pages_reuse_stored_posts(stub, data_store):
+    crawl_incremental(AGENCY, full=True)
+    # 5페이지의 게시글 제목 하나만 바꿉니다. 나머지 페이지는 목록 영역이 지난번과 같습니다.
+    body = stub.page_html(AGENCY, 5, LAST_PAGE)
+    stub.pages[(AGENCY, 5)] = body.replace("종합소득세".encode("utf-8"), "양도소득세".encode("utf-8"), 1)
+    metrics.reset()
+    crawl_incremental(AGENCY, full=True)
+    counters = metrics.snapshot()["counters"][BOARDS[AGENCY].label]
+    # 1페이지는 항상 새로 받고, 바뀐 5페이지만 다시 파싱합니다.
+    assert counters["unchanged_pages"] == LAST_PAGE - 2
+    titles = [change for change in store.load_changes(agency=AGENCY) if change["kind"] == store.CHANGE_TITLE]
+    assert len(titles) == 1
+    assert titles[0]["title"].count("양도소득세") == 1
+
+
+def test_incremental_refresh_after_full_crawl_fetches_one_page(stub, data_store):
+    full_count = crawl_incremental(AGENCY, full=True)
+    metrics.reset()
+    crawl_incremental(AGENCY)
+    assert store.load_crawl_status()[AGENCY]["pages"] == 1
+    assert store.count_records(AGENCY) == full_count
+    assert store.load_changes(agency=AGENCY) == []
@@ -0,0 +1,70 @@
+import os
+
+import metrics
+import crawler_common
+import crawler_kostat
+from agencies import BOARDS
+from crawler_common import find_last_page, iter_board, list_area_html, record_id
+from stub_server import FIXTURE_DIR
+
+
+def crawl(agency, **kwargs):
+    """대역 서버에서 기관 게시판을 크롤링해 [(페이지, 게시글 리스트)] 로 반환합니다."""
+    return list(iter_board(BOARDS[agency], **kwargs))
+
+
+def read_fixture(agency, page):
+    with open(os.path.join(FIXTURE_DIR, agency, f"page_{page:03d}.html"), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_find_last_page_returns_the_real_last_page():
+    html = read_fixture("kostat", 1)
+    assert find_last_page(html, crawler_kostat.PAGE_PATTERN) == 39
+    assert find_last_page("<html></html>", crawler_kostat.PAGE_PATTERN) is None
+    assert find_last_page(None, crawler_kostat.PAGE_PATTERN) is None
+
+
+def test_capped_crawl_reports_truncation(stub, monkeypatch):
+    monkeypatch.setattr(crawler_common, "MAX_PAGES", 5)
+    calls = []
+    pages = crawl("kostat", on_last_page=lambda page, truncated: calls.append((page, truncated)))
+    assert [page for page, _ in pages] == [1, 2, 3, 4, 5]
+    assert calls == [(5, True)]
+
+
+def test_full_crawl_reports_untruncated_last_page(stub):
+    calls = []
+    pages = crawl("kostat", on_last_page=lambda page, truncated: calls.append((page, truncated)))
+    assert [page for page, _ in pages] == list(range(1, 40))
+    assert calls == [(39, False)]
+
+
+def test_list_area_html_cuts_only_the_list_container():
+    html = read_fixture("kostat", 2)
+    area = list_area_html(html, crawler_kostat.LIST_AREA)
+    assert area.startswith("<div") and area.endswith("</div>")
+    assert "list_no=" in area
+    assert list_area_html(html, ("div", "no_such_class")) is None
+
+
+def test_incremental_crawl_stops_at_first_page_without_new_posts(stub):
+    pages = crawl("kostat")
+    known_ids = {record_id(record) for _, records in pages[3:] for record in records}
+    assert [page for page, _ in crawl("kostat", known_ids=known_ids)] == [1, 2, 3, 4]
+
+
+def test_incremental_crawl_with_nothing_new_fetches_one_page(stub):
+    known_ids = {record_id(record) for _, records in crawl("kostat") for record in records}
+    metrics.reset()
+    assert [page for page, _ in crawl("kostat", known_ids=known_ids)] == [1]
+    assert metrics.snapshot()["counters"][BOARDS["kostat"].label]["pages"] == 1
+
+
+def test_new_pinned_notice_does_not_walk_the_whole_board(stub):
+    # 국세청의 상단 고정 공지는 모든 페이지에 반복되므로, 새 고정 공지는 1페이지에서만 새 글로 봅니다.
+    pages = crawl("nts")
+    pinned = set.intersection(*({record_id(record) for record in records} for _, records in pages[:3]))
+    assert pinned
+    known_ids = {record_id(record) for _, records in pages for record in records} - pinned
+    assert [page for page, _ in crawl("nts", known_ids=known_ids)] == [1, 2]
@@ -0,0 +1,56 @@
+import datetime
+
+from search_index import DateIndex, TitleIndex, MODE_AND, MODE_OR, normalize
+
+TITLES = ["2026년 세법개정안 발표", "부가가치세 신고 안내", "Customs 공지", "세법 개정 설명회", "입찰 공고", ""]
+
+# store.load_batch 순서와 같이 등록일 내림차순, 날짜가 없는 행은 맨 뒤
+DATES = ["2025-03-03", "2025-03-01", "2025-03-01", "2025-02-28", "", "날짜 아님"]
+
+
+def day(text):
+    return datetime.date.fromisoformat(text)
+
+
+def brute_force(query, mode):
+    keywords = normalize(query).split()
+    match = all if mode == MODE_AND else any
+    return [row for row, title in enumerate(TITLES) if match(keyword in normalize(title) for keyword in keywords)]
+
+
+def test_title_search_matches_substring_scan():
+    index = TitleIndex(TITLES)
+    for query in ("개정", "세법 개정", "세", "세법개정안", "customs", "CUSTOMS 공지", "공고 세", "없는말", "a"):
+        for mode in (MODE_AND, MODE_OR):
+            assert index.search(query, mode) == brute_force(query, mode)
+            # 두 번째 검색은 캐시에서 나오지만 결과는 같아야 합니다.
+            assert index.search(query, mode) == brute_force(query, mode)
+
+
+def test_empty_query_returns_every_row():
+    assert TitleIndex(TITLES).search("  ") == list(range(len(TITLES)))
+
+
+def test_date_range_bounds_are_inclusive():
+    dates = DateIndex(DATES)
+    assert dates.range() == (0, 4)
+    assert dates.range(day("2025-03-01"), day("2025-03-01")) == (1, 3)
+    assert dates.range(day("2025-03-01"), day("2025-03-03")) == (0, 3)
+    assert dates.range(end=day("2025-02-28")) == (3, 4)
+    assert dates.range(start=day("2025-03-02")) == (0, 1)
+
+
+def test_date_range_outside_the_data_is_empty():
+    dates = DateIndex(DATES)
+    lo, hi = dates.range(start=day("2025-04-01"))
+    assert lo == hi
+    lo, hi = dates.range(end=day("2024-01-01"))
+    assert lo == hi
+    lo, hi = dates.range(day("2025-03-03"), day("2025-03-01"))
+    assert lo == hi
+
+
+def test_date_filter_keeps_rows_inside_the_range():
+    dates = DateIndex(DATES)
+    assert dates.filter([0, 2, 3, 4, 5], day("2025-03-01"), day("2025-03-01")) == [2]
+    assert dates.filter([0, 2, 3, 4, 5]) == [0, 2, 3]
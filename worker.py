@@ -0,0 +1,216 @@
+"""
+공지사항 크롤링 워커입니다. 스트림릿 화면(main.py)과 별도의 프로세스로 실행되어
+기관마다 정해진 주기로 크롤링하고 결과를 저장소(store.py)에 기록합니다.
+화면은 저장소만 읽으므로 페이지를 열 때 크롤링이 일어나지 않습니다.
+
+기관별 갱신 주기는 REFRESH_INTERVALS 로 정합니다. 게시글이 자주 올라오는 기관은 더 자주 갱신하며,
+갱신 시각에 무작위 지연(JITTER_RATIO)을 더하고 워커 시작 시 기관별 첫 갱신을 STAGGER 초씩 벌려
+여러 기관의 크롤링이 한 순간에 몰리지 않게 합니다. 동시에 크롤링하는 기관 수는 MAX_CONCURRENT_CRAWLS 로 제한합니다.
+마지막 갱신 시각은 저장소(crawl_status.snapshot_at)에서 읽으므로, 워커를 다시 시작해도
+아직 주기가 지나지 않은 기관은 바로 다시 크롤링하지 않습니다.
+
+평소 갱신은 새 글이 있는 앞쪽 페이지만 보는 증분 크롤링이라 게시판에서 삭제된 글은 알 수 없으므로,
+마지막 전체 크롤링(crawl_status.full_snapshot_at)에서 FULL_REFRESH_INTERVAL 시간이 지난 기관은
+다음 갱신을 전체 페이지로 합니다. (바뀌지 않은 페이지는 조건부 요청과 내용 해시로 건너뛰어 부담이 작습니다.)
+
+사용법:
+    python worker.py                    # 기관별 주기에 따라 계속 갱신
+    python worker.py --once             # 모든 기관을 한 번만 갱신하고 종료
+    python worker.py --full             # 시작할 때 모든 기관의 전체 페이지를 다시 크롤링
+    python worker.py --max-concurrent 1 # 한 번에 한 기관씩만 크롤링
+    python worker.py --metrics-port 9100  # http://127.0.0.1:9100/metrics 로 크롤링 지표(JSON) 제공
+    python worker.py --parse-processes 8  # 페이지 파싱을 프로세스 8개로 나누어 실행 (전체 크롤링이 코어 수만큼 빨라짐)
+
+크롤링 지표(metrics.py)는 기관 크롤링이 끝날 때마다 metrics.METRICS_PATH 에도 저장되어 화면의 진단 패널에서 볼 수 있습니다.
+"""
+import time
+import random
+import logging
+import argparse
+import datetime
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+import store
+import metrics
+from agencies import AGENCY_NAMES
+from crawl_state import crawl_incremental
+from crawler_common import PARSE_PROCESSES, set_parse_processes
+from orchestrator import run_parallel
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# 기관별 갱신 주기(분). 게시글이 자주 올라오는(페이지 수가 많은) 기관일수록 짧게 잡습니다.
+REFRESH_INTERVALS = {
+    "pps": 60,       # 조달청 (175페이지)
+    "customs": 90,   # 관세청 (150페이지)
+    "moef": 180,     # 기획재정부 (80페이지)
+    "nts": 180,      # 국세청 (59페이지)
+    "kostat": 360,   # 통계청 (39페이지)
+}
+# 주기에 없는 기관의 갱신 주기(분)
+DEFAULT_INTERVAL = 180
+
+# 다음 갱신 시각에 더하는 무작위 지연의 최대 비율 (0.1 이면 주기의 0~10%)
+JITTER_RATIO = 0.1
+
+# 워커 시작 시 갱신이 필요한 기관들의 첫 크롤링 간격(초)
+STAGGER = 30
+
+# 게시판에서 삭제된 글을 찾기 위해 기관마다 전체 페이지를 다시 크롤링하는 주기(시간)
+FULL_REFRESH_INTERVAL = 24
+
+# 크롤링에 실패한 기관을 다시 시도하기까지 기다리는 시간(분). 주기가 이보다 짧으면 주기를 따릅니다.
+ERROR_RETRY = 10
+
+# 동시에 크롤링하는 기관 수
+MAX_CONCURRENT_CRAWLS = 2
+
+# 예정된 갱신이 없을 때 다음 확인까지 최대 대기 시간(초)
+POLL_INTERVAL = 30
+
+
+def refresh_interval(agency):
+    """기관의 갱신 주기를 초 단위로 반환합니다."""
+    return REFRESH_INTERVALS.get(agency, DEFAULT_INTERVAL) * 60
+
+
+def next_refresh_time(agency, last_refresh, failed=False):
+    """
+    마지막 갱신 시각(last_refresh, time.time() 값)을 기준으로 다음 갱신 시각을 반환합니다.
+    주기에 0~JITTER_RATIO 비율의 무작위 지연을 더해 기관들의 갱신 시각이 겹치지 않게 합니다.
+    failed=True 이면 주기 대신 ERROR_RETRY 분 뒤에 다시 시도합니다.
+    """
+    interval = refresh_interval(agency)
+    if failed:
+        interval = min(interval, ERROR_RETRY * 60)
+    return last_refresh + interval + random.uniform(0, interval * JITTER_RATIO)
+
+
+def needs_full_refresh(agency, crawl_status, now=None):
+    """기관의 마지막 전체 크롤링(full_snapshot_at)이 없거나 FULL_REFRESH_INTERVAL 시간이 지났으면 True 를 반환합니다."""
+    now = time.time() if now is None else now
+    full_snapshot_at = (crawl_status.get(agency) or {}).get("full_snapshot_at")
+    return not full_snapshot_at or now - full_snapshot_at >= FULL_REFRESH_INTERVAL * 3600
+
+
+def initial_schedule(now=None, ignore_ttl=False):
+    """
+    워커 시작 시 기관별 첫 갱신 시각을 {기관: 시각} 으로 반환합니다.
+    저장소에 기록된 마지막 갱신 시각(snapshot_at)이 주기 안이면 그 주기가 끝날 때로 잡고,
+    갱신이 필요한 기관들은 STAGGER 초 간격으로 차례로 시작합니다.
+    ignore_ttl=True 이면 모든 기관을 갱신이 필요한 것으로 봅니다.
+    """
+    now = time.time() if now is None else now
+    crawl_status = {} if ignore_ttl else store.load_crawl_status()
+    due = {}
+    stale = 0
+    for agency in AGENCY_NAMES:
+        snapshot_at = (crawl_status.get(agency) or {}).get("snapshot_at")
+        if snapshot_at and now - snapshot_at < refresh_interval(agency):
+            due[agency] = next_refresh_time(agency, snapshot_at)
+        else:
+            due[agency] = now + stale * STAGGER
+            stale += 1
+    return due
+
+
+def run_scheduler(max_concurrent=MAX_CONCURRENT_CRAWLS, full=False):
+    """
+    기관별 주기에 따라 크롤링을 계속 실행합니다. 갱신 시각이 된 기관을 최대 max_concurrent 개까지
+    동시에 크롤링하며, 같은 기관의 크롤링이 겹치지 않도록 끝난 뒤에 다음 갱신 시각을 정합니다.
+    full=True 이면 워커 시작 직후 기관별 첫 갱신을 전체 페이지로 크롤링하고, 그 뒤로는
+    전체 크롤링한 지 FULL_REFRESH_INTERVAL 시간이 지난 기관만 전체 페이지로 크롤링합니다. (needs_full_refresh)
+    """
+    due = initial_schedule(ignore_ttl=full)
+    full_pending = set(AGENCY_NAMES) if full else set()
+    running = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, max_concurrent))
+    for agency, at in sorted(due.items(), key=lambda item: item[1]):
+        logging.info(f"{AGENCY_NAMES[agency]} 첫 갱신 예정: {datetime.datetime.fromtimestamp(at):%Y-%m-%d %H:%M:%S}")
+    try:
+        while True:
+            now = time.time()
+            for agency, future in list(running.items()):
+                if not future.done():
+                    continue
+                del running[agency]
+                error = future.exception()
+                if error is not None:
+                    logging.error(f"{AGENCY_NAMES[agency]} 갱신 실패: {error}")
+                else:
+                    logging.info(f"{AGENCY_NAMES[agency]} 갱신 완료: {future.result()}건 저장")
+                metrics.dump()
+                due[agency] = next_refresh_time(agency, now, failed=error is not None)
+                logging.info(
+                    f"{AGENCY_NAMES[agency]} 다음 갱신 예정: "
+                    f"{datetime.datetime.fromtimestamp(due[agency]):%Y-%m-%d %H:%M:%S}"
+                )
+
+            # 갱신 시각이 지난 기관부터 빈 자리만큼 시작합니다. 나머지는 자리가 날 때까지 기다립니다.
+            ready = sorted((at, agency) for agency, at in due.items() if at <= now and agency not in running)
+            crawl_status = store.load_crawl_status() if ready else {}
+            for _, agency in ready[:max(0, max_concurrent - len(running))]:
+                full_crawl = agency in full_pending or needs_full_refresh(agency, crawl_status, now)
+                logging.info(f"{AGENCY_NAMES[agency]} {'전체 ' if full_crawl else ''}갱신 시작")
+                running[agency] = executor.submit(crawl_incremental, agency, full=full_crawl)
+                full_pending.discard(agency)
+
+            upcoming = [at for agency, at in due.items() if agency not in running]
+            sleep_for = min([POLL_INTERVAL] + [at - now for at in upcoming])
+            if running:
+                sleep_for = min(sleep_for, 1)
+            time.sleep(max(sleep_for, 0.1))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def refresh_all(full=False, max_concurrent=MAX_CONCURRENT_CRAWLS):
+    """
+    모든 기관을 한 번씩 크롤링하여 저장소를 갱신합니다. 한 기관의 실패가 다른 기관을 막지 않습니다.
+    full=False 이어도 전체 크롤링할 때가 된 기관(needs_full_refresh)은 전체 페이지를 크롤링합니다.
+    """
+    def on_done(key, result, error, elapsed):
+        if error is not None:
+            logging.error(f"{AGENCY_NAMES[key]} 갱신 실패 ({elapsed:.1f}초): {error}")
+        else:
+            logging.info(f"{AGENCY_NAMES[key]} 갱신 완료: {result}건 저장 ({elapsed:.1f}초)")
+        metrics.dump()
+
+    crawl_status = store.load_crawl_status()
+    tasks = [
+        (agency, partial(crawl_incremental, agency, full=full or needs_full_refresh(agency, crawl_status)))
+        for agency in AGENCY_NAMES
+    ]
+    run_parallel(tasks, on_done=on_done, max_workers=max_concurrent)
+    logging.info(f"공지사항 업데이트 작업 실행: {datetime.datetime.now()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공지사항 크롤링 워커")
+    parser.add_argument("--once", action="store_true", help="모든 기관을 한 번만 갱신하고 종료합니다.")
+    parser.add_argument("--full", action="store_true", help="시작할 때 모든 기관의 전체 페이지를 다시 크롤링합니다.")
+    parser.add_argument(
+        "--max-concurrent", type=int, default=MAX_CONCURRENT_CRAWLS,
+        help=f"동시에 크롤링할 기관 수 (기본값 {MAX_CONCURRENT_CRAWLS})"
+    )
+    parser.add_argument("--metrics-port", type=int, help="크롤링 지표를 JSON 으로 제공할 로컬 포트")
+    parser.add_argument(
+        "--parse-processes", type=int, default=PARSE_PROCESSES,
+        help=f"페이지 파싱에 쓸 프로세스 수 (0 이면 크롤링 스레드에서 파싱, 기본값 {PARSE_PROCESSES})"
+    )
+    args = parser.parse_args()
+
+    set_parse_processes(args.parse_processes)
+
+    if args.metrics_port:
+        metrics.serve(args.metrics_port)
+        logging.info(f"크롤링 지표 제공 중: http://127.0.0.1:{args.metrics_port}/metrics")
+    if args.once:
+        refresh_all(full=args.full, max_concurrent=args.max_concurrent)
+        return
+    run_scheduler(max_concurrent=args.max_concurrent, full=args.full)
+
+
+if __name__ == "__main__":
+    main()